@@ -0,0 +1,161 @@
+import json
+import logging
+import queue
+import threading
+from collections import deque
+from typing import Dict, Any, Optional, List, Deque, Set
+
+import allure
+import requests
+
+
+class AllureAttachmentWriter:
+    """
+    Background writer for APIClient request/response traces.
+
+    Interactions are rendered on a worker thread and kept in a per-test ring
+    buffer; nothing touches the disk unless the test fails and is flushed.
+    """
+
+    def __init__(self, history_size: int = 20, max_body_bytes: int = 16 * 1024, batch_size: int = 50):
+        self.history_size = history_size
+        self.max_body_bytes = max_body_bytes
+        self.batch_size = batch_size
+        self.logger = logging.getLogger(__name__)
+
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._buffers: Dict[str, Deque[str]] = {}
+        self._lock = threading.Lock()
+        self._current_test: Optional[str] = None
+        self._flushed: Set[str] = set()
+        self._worker: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the background rendering thread"""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._worker = threading.Thread(target=self._run, name="allure-attachment-writer", daemon=True)
+        self._worker.start()
+
+    def close(self):
+        """Drain pending interactions and stop the background thread"""
+        if self._worker is None:
+            return
+        self._queue.put(None)
+        self._worker.join()
+        self._worker = None
+
+    def begin_test(self, test_id: str):
+        """Route subsequent interactions to the ring buffer of the given test; later clients share it"""
+        with self._lock:
+            if test_id != self._current_test or test_id not in self._buffers:
+                self._buffers[test_id] = deque(maxlen=self.history_size)
+            self._current_test = test_id
+
+    def record(self, method: str, url: str, request_body: Any = None,
+               response: Optional[requests.Response] = None, error: Optional[BaseException] = None,
+               elapsed: float = 0.0):
+        """Queue a single interaction; cheap enough to call from APIClient._request"""
+        test_id = self._current_test
+        if test_id is None:
+            return
+        if self._worker is None:
+            self.start()
+
+        entry = {
+            "test_id": test_id,
+            "method": method,
+            "url": url,
+            # Serialized here: the caller may change its dict before the worker renders it
+            "request_body": json.dumps(request_body, indent=2, default=str) if request_body is not None else None,
+            "elapsed": elapsed,
+            "error": repr(error) if error is not None else None,
+        }
+        if response is not None:
+            entry["status_code"] = response.status_code
+            entry["response_headers"] = dict(response.headers)
+            entry["response_body"] = response.content
+        self._queue.put(entry)
+
+    def flush(self, test_id: str, name: str = "HTTP trace"):
+        """Attach the buffered interactions of a test to the Allure report"""
+        self._queue.join()
+        with self._lock:
+            entries = list(self._buffers.get(test_id, ()))
+        if not entries:
+            return
+        allure.attach(
+            "\n\n".join(entries),
+            name=f"{name} (last {len(entries)} requests)",
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+    def report_phase(self, test_id: str, failed: bool, finished: bool):
+        """Flush on the first failed phase of a test only; drop its buffer once the test finished"""
+        if failed and test_id not in self._flushed:
+            self._flushed.add(test_id)
+            self.flush(test_id)
+        if finished:
+            self._flushed.discard(test_id)
+            self.discard(test_id)
+
+    def discard(self, test_id: str):
+        """Drop the buffered interactions of a test"""
+        with self._lock:
+            self._buffers.pop(test_id, None)
+            if self._current_test == test_id:
+                self._current_test = None
+
+    def _run(self):
+        """Render queued interactions in batches"""
+        while True:
+            batch: List[Optional[Dict[str, Any]]] = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            rendered = []
+            for entry in batch:
+                if entry is None:
+                    stop = True
+                    continue
+                try:
+                    rendered.append((entry["test_id"], self._render(entry)))
+                except Exception as e:
+                    self.logger.warning(f"Failed to render API trace: {e}")
+
+            with self._lock:
+                for test_id, text in rendered:
+                    buffer = self._buffers.get(test_id)
+                    if buffer is not None:
+                        buffer.append(text)
+
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _render(self, entry: Dict[str, Any]) -> str:
+        """Format one interaction as plain text"""
+        lines = [f"{entry['method']} {entry['url']}"]
+        if entry["request_body"] is not None:
+            lines.append(f"Request body:\n{self._truncate(entry['request_body'].encode('utf-8'))}")
+        if "status_code" in entry:
+            lines.append(f"Response status: {entry['status_code']} ({entry['elapsed']:.3f}s)")
+            headers = "\n".join(f"  {key}: {value}" for key, value in entry["response_headers"].items())
+            lines.append(f"Response headers:\n{headers}")
+            if entry["response_body"]:
+                lines.append(f"Response body:\n{self._truncate(entry['response_body'])}")
+        if entry["error"]:
+            lines.append(f"Error: {entry['error']} ({entry['elapsed']:.3f}s)")
+        return "\n".join(lines)
+
+    def _truncate(self, body: bytes) -> str:
+        """Cap a body at max_body_bytes"""
+        text = body[:self.max_body_bytes].decode("utf-8", errors="replace")
+        if len(body) > self.max_body_bytes:
+            text += f"\n... truncated {len(body) - self.max_body_bytes} of {len(body)} bytes"
+        return text
@@ -1,20 +1,31 @@
 import requests
 import logging
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Callable, TYPE_CHECKING
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+import sys
 import time
 
 from src.api.endpoints import Endpoints
+from src.api.attachments import AllureAttachmentWriter
+
+if TYPE_CHECKING:
+    from src.api.pet_index import PetIndex
 
 class APIClient:
     """
     API Client for Petstore with retry mechanism and logging
     """
     
-    def __init__(self, base_url: str = "https://petstore.swagger.io/v2", timeout: int = 30):
+    def __init__(self, base_url: str = "https://petstore.swagger.io/v2", timeout: int = 30,
+                 attachment_writer: Optional[AllureAttachmentWriter] = None):
         self.base_url = base_url
         self.timeout = timeout
+        self.attachment_writer = attachment_writer
+        # Called with (method, endpoint, seconds) after every request
+        self.latency_hooks: List[Callable[[str, str, float], None]] = []
+        # Set by PetIndex to keep it current with this client's own writes
+        self.pet_index: Optional["PetIndex"] = None
         self.session = requests.Session()
         self.logger = logging.getLogger(__name__)
         
@@ -54,7 +65,8 @@ class APIClient:
         
         self._log_request(method, url, **kwargs)
         
-        start_time = time.time()
+        response = None
+        start_time = time.perf_counter()
         try:
             response = self.session.request(
                 method=method,
@@ -70,7 +82,7 @@ class APIClient:
             return response.json() if response.content else {}
             
         except requests.exceptions.HTTPError as e:
-            self.logger.error(f"HTTP error: {e} - {response.text if 'response' in locals() else ''}")
+            self.logger.error(f"HTTP error: {e} - {response.text if response is not None else ''}")
             raise
         except requests.exceptions.ConnectionError as e:
             self.logger.error(f"Connection error: {e}")
@@ -82,13 +94,34 @@ class APIClient:
             self.logger.error(f"Request error: {e}")
             raise
         finally:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self.logger.info(f"Request executed in {execution_time:.2f}s")
+            self._notify(method, url, endpoint, kwargs.get('json'), response, sys.exc_info()[1], execution_time)
+    
+    def _notify(self, method: str, url: str, endpoint: str, request_body: Any,
+                response: Optional[requests.Response], error: Optional[BaseException], execution_time: float):
+        """Feed attachment writer and latency hooks; their failures never change the request outcome"""
+        if self.attachment_writer is not None:
+            try:
+                self.attachment_writer.record(
+                    method, url, request_body,
+                    response=response, error=error, elapsed=execution_time
+                )
+            except Exception as e:
+                self.logger.warning(f"Attachment writer failed: {e}")
+        for hook in self.latency_hooks:
+            try:
+                hook(method, endpoint, execution_time)
+            except Exception as e:
+                self.logger.warning(f"Latency hook {hook!r} failed: {e}")
     
     # Pet endpoints
     def add_pet(self, pet_data: Dict[str, Any]) -> Dict[str, Any]:
         """Add a new pet to the store"""
-        return self._request("POST", Endpoints.PET, json=pet_data)
+        response = self._request("POST", Endpoints.PET.value, json=pet_data)
+        if self.pet_index is not None:
+            self.pet_index.upsert(response)
+        return response
     
     def get_pet(self, pet_id: int) -> Dict[str, Any]:
         """Find pet by ID"""
@@ -96,21 +129,22 @@ class APIClient:
     
     def update_pet(self, pet_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing pet"""
-        return self._request("PUT", Endpoints.PET, json=pet_data)
+        response = self._request("PUT", Endpoints.PET.value, json=pet_data)
+        if self.pet_index is not None:
+            self.pet_index.upsert(response)
+        return response
     
     def delete_pet(self, pet_id: int, api_key: str = "special-key") -> Dict[str, Any]:
         """Delete a pet"""
         headers = {"api_key": api_key}
-        return self._request("DELETE", Endpoints.PET_BY_ID.format(pet_id=pet_id), headers=headers)
+        response = self._request("DELETE", Endpoints.PET_BY_ID.format(pet_id=pet_id), headers=headers)
+        if self.pet_index is not None:
+            self.pet_index.remove(pet_id)
+        return response
     
     def find_pets_by_status(self, status: str) -> List[Dict[str, Any]]:
         """Finds Pets by status"""
-        return self._request("GET", f"{Endpoints.PET_FIND_BY_STATUS}?status={status}"
-Redirecting...
-self.logger.info
-
-
-)
+        return self._request("GET", f"{Endpoints.PET_FIND_BY_STATUS.value}?status={status}")
     
     def upload_pet_image(self, pet_id: int, image_data: bytes, additional_metadata: str = "") -> Dict[str, Any]:
         """Uploads an image for a pet"""
@@ -121,7 +155,7 @@ self.logger.info
     # Store endpoints
     def place_order(self, order_data: Dict[str, Any]) -> Dict[str, Any]:
         """Place an order for a pet"""
-        return self._request("POST", Endpoints.STORE_ORDER, json=order_data)
+        return self._request("POST", Endpoints.STORE_ORDER.value, json=order_data)
     
     def get_order(self, order_id: int) -> Dict[str, Any]:
         """Find purchase order by ID"""
@@ -133,12 +167,12 @@ self.logger.info
     
     def get_inventory(self) -> Dict[str, Any]:
         """Returns pet inventories by status"""
-        return self._request("GET", Endpoints.STORE_INVENTORY)
+        return self._request("GET", Endpoints.STORE_INVENTORY.value)
     
     # User endpoints
     def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create user"""
-        return self._request("POST", Endpoints.USER, json=user_data)
+        return self._request("POST", Endpoints.USER.value, json=user_data)
     
     def get_user(self, username: str) -> Dict[str, Any]:
         """Get user by user name"""
@@ -154,12 +188,12 @@ self.logger.info
     
     def login_user(self, username: str, password: str) -> Dict[str, Any]:
         """Logs user into the system"""
-        return self._request("GET", f"{Endpoints.USER_LOGIN}?username={username}&password={password}")
+        return self._request("GET", f"{Endpoints.USER_LOGIN.value}?username={username}&password={password}")
     
     def logout_user(self) -> Dict[str, Any]:
         """Logs out current logged in user session"""
-        return self._request("GET", Endpoints.USER_LOGOUT)
+        return self._request("GET", Endpoints.USER_LOGOUT.value)
     
     def create_users_with_list(self, users_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Creates list of users with given input array"""
-        return self._request("POST", Endpoints.USER_CREATE_WITH_LIST, json=users_data)
+        return self._request("POST", Endpoints.USER_CREATE_WITH_LIST.value, json=users_data)
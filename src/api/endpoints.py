@@ -0,0 +1,36 @@
+from enum import Enum
+from functools import lru_cache
+
+class Endpoints(str, Enum):
+    # Pet endpoints
+    PET = "/pet"
+    PET_BY_ID = "/pet/{pet_id}"
+    PET_FIND_BY_STATUS = "/pet/findByStatus"
+    PET_UPLOAD_IMAGE = "/pet/{pet_id}/uploadImage"
+    
+    # Store endpoints
+    STORE_INVENTORY = "/store/inventory"
+    STORE_ORDER = "/store/order"
+    STORE_ORDER_BY_ID = "/store/order/{order_id}"
+    
+    # User endpoints
+    USER = "/user"
+    USER_BY_USERNAME = "/user/{username}"
+    USER_LOGIN = "/user/login"
+    USER_LOGOUT = "/user/logout"
+    USER_CREATE_WITH_LIST = "/user/createWithList"
+
+
+@lru_cache(maxsize=1024)
+def endpoint_template(path: str) -> str:
+    """Endpoint template a request path was built from, e.g. /pet/42 -> /pet/{pet_id}"""
+    path = path.split("?", 1)[0]
+    parts = path.split("/")
+    # Literal endpoints first so /pet/findByStatus does not match /pet/{pet_id}
+    for endpoint in sorted(Endpoints, key=lambda e: "{" in e.value):
+        template = endpoint.value.split("/")
+        if len(template) == len(parts) and all(
+            t == p or t.startswith("{") for t, p in zip(template, parts)
+        ):
+            return endpoint.value
+    return path
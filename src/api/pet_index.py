@@ -0,0 +1,176 @@
+import bisect
+import copy
+import logging
+import time
+from typing import Dict, Any, Optional, List, Set, Iterable, Union, TYPE_CHECKING
+
+from src.models.pet import PetStatus
+from src.models.batch import PetBatch
+
+if TYPE_CHECKING:
+    from src.api.client import APIClient
+
+
+class PetIndex:
+    """
+    Client-side secondary index of pets by tag, category, name and status.
+
+    Filled per status from find_pets_by_status and kept current by the
+    client's own add_pet/update_pet/delete_pet calls. Each status listing
+    is re-fetched on its own once older than max_age seconds.
+    """
+
+    def __init__(self, client: "APIClient", max_age: float = 300.0,
+                 statuses: Iterable[Union[PetStatus, str]] = tuple(PetStatus)):
+        self.client = client
+        self.max_age = max_age
+        self.statuses = [PetStatus(status).value for status in statuses]
+        self.logger = logging.getLogger(__name__)
+
+        self.pets: Dict[int, Dict[str, Any]] = {}
+        self.by_status: Dict[str, Set[int]] = {}
+        self.by_tag: Dict[str, Set[int]] = {}
+        self.by_category: Dict[str, Set[int]] = {}
+        self._names: List[tuple] = []  # sorted (name, id) pairs for prefix search
+        self._fetched_at: Dict[str, float] = {}
+        self._written_at: Dict[int, float] = {}  # last client write per pet id, deletes included
+
+        client.pet_index = self
+
+    # Refresh policy
+    def is_stale(self, status: str) -> bool:
+        fetched_at = self._fetched_at.get(status)
+        return fetched_at is None or time.monotonic() - fetched_at > self.max_age
+
+    def refresh(self, statuses: Optional[Iterable[Union[PetStatus, str]]] = None, force: bool = False):
+        """Re-fetch the listings of stale statuses only"""
+        for status in [PetStatus(status).value for status in statuses] if statuses else self.statuses:
+            if force or self.is_stale(status):
+                self._load_status(status)
+
+    def invalidate(self, status: Optional[Union[PetStatus, str]] = None):
+        """Mark one or all status listings stale"""
+        if status is None:
+            self._fetched_at.clear()
+        else:
+            self._fetched_at.pop(PetStatus(status).value, None)
+
+    def _load_status(self, status: str):
+        """Replace the pets of one status with a fresh listing, keeping client writes made since"""
+        fetched_at = time.monotonic()
+        listing = [pet for pet in self.client.find_pets_by_status(status) if pet.get("id") is not None]
+        listed_ids = {pet["id"] for pet in listing}
+        for pet_id in self.by_status.get(status, set()) - listed_ids:
+            if not self._written_since(pet_id, fetched_at):
+                self._drop(pet_id)
+        for pet in listing:
+            if not self._written_since(pet["id"], fetched_at):
+                self._drop(pet["id"])
+                self._add(pet)
+        self._fetched_at[status] = fetched_at
+        self.logger.info(f"Indexed {len(listed_ids)} pets with status {status}")
+
+    def _written_since(self, pet_id: int, since: float) -> bool:
+        return self._written_at.get(pet_id, float("-inf")) >= since
+
+    # Maintenance, called by APIClient
+    def upsert(self, pet: Dict[str, Any]):
+        """Add or replace a pet written by the client"""
+        pet_id = pet.get("id")
+        if pet_id is None:
+            return
+        self._written_at[pet_id] = time.monotonic()
+        self._drop(pet_id)
+        self._add(pet)
+
+    def remove(self, pet_id: int):
+        """Drop a pet deleted by the client"""
+        self._written_at[pet_id] = time.monotonic()
+        self._drop(pet_id)
+
+    def _add(self, pet: Dict[str, Any]):
+        """Add a copy of a pet to every secondary index, so caller edits cannot desync them"""
+        pet = copy.deepcopy(pet)
+        pet_id = pet["id"]
+        self.pets[pet_id] = pet
+        for key, index in self._keys(pet):
+            index.setdefault(key, set()).add(pet_id)
+        if isinstance(pet.get("name"), str):
+            bisect.insort(self._names, (pet["name"], pet_id))
+
+    def _drop(self, pet_id: int):
+        """Drop a pet from every secondary index"""
+        pet = self.pets.pop(pet_id, None)
+        if pet is None:
+            return
+        for key, index in self._keys(pet):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(pet_id)
+                if not ids:
+                    del index[key]
+        if isinstance(pet.get("name"), str):
+            position = bisect.bisect_left(self._names, (pet["name"], pet_id))
+            if position < len(self._names) and self._names[position] == (pet["name"], pet_id):
+                del self._names[position]
+
+    def _keys(self, pet: Dict[str, Any]):
+        """(key, index) pairs a pet is listed under"""
+        if pet.get("status") is not None:
+            yield pet["status"], self.by_status
+        for tag in pet.get("tags") or []:
+            if tag.get("name") is not None:
+                yield tag["name"], self.by_tag
+        category = pet.get("category") or {}
+        if category.get("name") is not None:
+            yield category["name"], self.by_category
+
+    # Lookups
+    def get(self, pet_id: int) -> Optional[Dict[str, Any]]:
+        """Copy of an indexed pet"""
+        pet = self.pets.get(pet_id)
+        return copy.deepcopy(pet) if pet is not None else None
+
+    def find(self, status: Optional[Union[PetStatus, str, Iterable[Union[PetStatus, str]]]] = None,
+             tags: Iterable[str] = (), category: Optional[str] = None,
+             name_prefix: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Copies of pets matching every criterion; status may be one or several, tags must all match"""
+        if status is None:
+            statuses = self.statuses
+        elif isinstance(status, str):
+            statuses = [PetStatus(status).value]
+        else:
+            statuses = [PetStatus(item).value for item in status]
+        self.refresh(statuses)
+
+        candidates: List[Set[int]] = [set().union(*(self.by_status.get(item, set()) for item in statuses))]
+        candidates.extend(self.by_tag.get(tag, set()) for tag in tags)
+        if category is not None:
+            candidates.append(self.by_category.get(category, set()))
+        if name_prefix is not None:
+            candidates.append(self._ids_with_name_prefix(name_prefix))
+
+        candidates.sort(key=len)
+        ids = candidates[0].intersection(*candidates[1:])
+        return [copy.deepcopy(self.pets[pet_id]) for pet_id in sorted(ids)]
+
+    def find_by_tag(self, tag: str, status=None) -> List[Dict[str, Any]]:
+        return self.find(status=status, tags=[tag])
+
+    def find_by_category(self, category: str, status=None) -> List[Dict[str, Any]]:
+        return self.find(status=status, category=category)
+
+    def find_by_name_prefix(self, prefix: str, status=None) -> List[Dict[str, Any]]:
+        return self.find(status=status, name_prefix=prefix)
+
+    def to_batch(self, status=None) -> PetBatch:
+        """Columnar snapshot for bulk assertions"""
+        return PetBatch.from_dicts(self.find(status=status))
+
+    def _ids_with_name_prefix(self, prefix: str) -> Set[int]:
+        position = bisect.bisect_left(self._names, (prefix,))
+        ids = set()
+        while position < len(self._names) and self._names[position][0].startswith(prefix):
+            ids.add(self._names[position][1])
+            position += 1
+        return ids
@@ -0,0 +1,362 @@
+import json
+import re
+import sys
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Iterable, Sequence, Union
+
+import numpy as np
+
+from src.models.pet import Pet, PetStatus
+from src.models.store import Order, OrderStatus
+
+MISSING = -1
+NO_ID = np.iinfo(np.int64).min
+PET_STATUSES = list(PetStatus)
+ORDER_STATUSES = list(OrderStatus)
+
+Selector = Union[np.ndarray, Sequence[int], slice]
+
+
+class StringTable:
+    """
+    Interned string dictionary shared by a batch and every batch filtered from it
+    """
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def code(self, value: Optional[str]) -> int:
+        """Code of value, adding it to the table; MISSING for None"""
+        if value is None:
+            return MISSING
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(sys.intern(value))
+        return code
+
+    def lookup(self, code: int) -> Optional[str]:
+        return self.values[code] if code != MISSING else None
+
+    def matching(self, predicate) -> np.ndarray:
+        """Codes of all strings satisfying predicate"""
+        return np.array([code for code, value in enumerate(self.values) if predicate(value)], dtype=np.int32)
+
+
+class RaggedCodes:
+    """
+    Variable-length lists of codes or ids in CSR layout (offsets + flat values)
+    """
+
+    def __init__(self, offsets: np.ndarray, values: np.ndarray):
+        self.offsets = offsets
+        self.values = values
+
+    @classmethod
+    def from_lists(cls, lists: List[List[int]], dtype=np.int32) -> "RaggedCodes":
+        lengths = np.fromiter((len(item) for item in lists), dtype=np.int64, count=len(lists))
+        offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        values = np.fromiter((code for item in lists for code in item), dtype=dtype, count=int(offsets[-1]))
+        return cls(offsets, values)
+
+    def row(self, index: int) -> np.ndarray:
+        return self.values[self.offsets[index]:self.offsets[index + 1]]
+
+    def take(self, indices: np.ndarray) -> "RaggedCodes":
+        """Rows at indices, without a Python loop"""
+        starts = self.offsets[indices]
+        lengths = self.offsets[indices + 1] - starts
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        positions = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        return RaggedCodes(offsets, self.values[positions])
+
+    def rows_containing(self, codes: np.ndarray) -> np.ndarray:
+        """Boolean mask of rows holding any of codes"""
+        rows = np.repeat(np.arange(len(self.offsets) - 1), np.diff(self.offsets))
+        mask = np.zeros(len(self.offsets) - 1, dtype=bool)
+        mask[rows[np.isin(self.values, codes)]] = True
+        return mask
+
+
+def _status_codes(statuses: Iterable[Any], enum_values: List[Any]) -> np.ndarray:
+    """Enum statuses as int8 codes; unknown or missing statuses become MISSING"""
+    lookup = {status.value: code for code, status in enumerate(enum_values)}
+    return np.fromiter(
+        (lookup.get(getattr(status, "value", status), MISSING) for status in statuses),
+        dtype=np.int8
+    )
+
+
+def _status_counts(codes: np.ndarray, enum_values: List[Any]) -> Dict[str, int]:
+    """Per-status counts, like the store inventory"""
+    counts = np.bincount(codes[codes != MISSING].astype(np.int64), minlength=len(enum_values))
+    return {status.value: int(count) for status, count in zip(enum_values, counts)}
+
+
+def _ids(values: Iterable[Optional[int]]) -> np.ndarray:
+    return np.fromiter((NO_ID if value is None else value for value in values), dtype=np.int64)
+
+
+def _optional_id(value: np.int64) -> Optional[int]:
+    return None if value == NO_ID else int(value)
+
+
+def _without_none(**values: Any) -> Dict[str, Any]:
+    return {key: value for key, value in values.items() if value is not None}
+
+
+def _parse_ship_date(value: Any) -> np.datetime64:
+    """Petstore shipDate (ISO string or datetime) as UTC datetime64[ms]; naive values are local time"""
+    if value is None:
+        return np.datetime64("NaT", "ms")
+    if isinstance(value, str):
+        # Petstore answers with "+0000" offsets which fromisoformat rejects before Python 3.11
+        value = datetime.fromisoformat(re.sub(r"(Z|[+-]\d{2}:?\d{2})$", _iso_offset, value))
+    # astimezone() takes naive values as local time, like Order's datetime.now() default
+    value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(value, "ms")
+
+
+def _iso_offset(match) -> str:
+    offset = match.group(1)
+    if offset == "Z":
+        return "+00:00"
+    return offset if ":" in offset else f"{offset[:3]}:{offset[3:]}"
+
+
+class PetBatch:
+    """
+    Columnar collection of pets: typed arrays instead of Pet instances.
+
+    Strings are interned into per-column tables shared with every filtered
+    batch, so filtering copies only the integer columns.
+    """
+
+    def __init__(self, ids: np.ndarray, names: np.ndarray, statuses: np.ndarray,
+                 category_ids: np.ndarray, categories: np.ndarray,
+                 tag_ids: RaggedCodes, tags: RaggedCodes, photo_urls: RaggedCodes,
+                 tables: Dict[str, StringTable]):
+        self.ids = ids
+        self.names = names
+        self.statuses = statuses
+        self.category_ids = category_ids
+        self.categories = categories
+        self.tag_ids = tag_ids
+        self.tags = tags
+        self.photo_urls = photo_urls
+        self.tables = tables
+
+    @classmethod
+    def from_dicts(cls, pets: Sequence[Dict[str, Any]]) -> "PetBatch":
+        """Build from API responses such as find_pets_by_status, without Pet validation"""
+        tables = {column: StringTable() for column in ("name", "category", "tag", "photo_url")}
+        categories = [pet.get("category") or {} for pet in pets]
+        tags = [pet.get("tags") or [] for pet in pets]
+        return cls(
+            ids=_ids(pet.get("id") for pet in pets),
+            names=np.fromiter((tables["name"].code(pet.get("name")) for pet in pets),
+                              dtype=np.int32, count=len(pets)),
+            statuses=_status_codes((pet.get("status") for pet in pets), PET_STATUSES),
+            category_ids=_ids(category.get("id") for category in categories),
+            categories=np.fromiter((tables["category"].code(category.get("name")) for category in categories),
+                                   dtype=np.int32, count=len(pets)),
+            tag_ids=RaggedCodes.from_lists(
+                [[NO_ID if tag.get("id") is None else tag["id"] for tag in row] for row in tags], dtype=np.int64
+            ),
+            tags=RaggedCodes.from_lists([[tables["tag"].code(tag.get("name")) for tag in row] for row in tags]),
+            photo_urls=RaggedCodes.from_lists([
+                [tables["photo_url"].code(url) for url in pet.get("photoUrls") or []] for pet in pets
+            ]),
+            tables=tables
+        )
+
+    @classmethod
+    def from_models(cls, pets: Sequence[Pet]) -> "PetBatch":
+        return cls.from_dicts([pet.dict() for pet in pets])
+
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "PetBatch":
+        return cls.from_dicts(json.loads(data))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, selector: Selector) -> "PetBatch":
+        """Rows by boolean mask, index array or slice"""
+        indices = np.arange(len(self))[selector]
+        return PetBatch(
+            ids=self.ids[indices],
+            names=self.names[indices],
+            statuses=self.statuses[indices],
+            category_ids=self.category_ids[indices],
+            categories=self.categories[indices],
+            tag_ids=self.tag_ids.take(indices),
+            tags=self.tags.take(indices),
+            photo_urls=self.photo_urls.take(indices),
+            tables=self.tables
+        )
+
+    # Vectorized filters
+    def status_mask(self, status: Union[PetStatus, str]) -> np.ndarray:
+        return self.statuses == PET_STATUSES.index(PetStatus(status))
+
+    def tag_mask(self, tag_name: str) -> np.ndarray:
+        return self.tags.rows_containing(self.tables["tag"].matching(lambda value: value == tag_name))
+
+    def category_mask(self, category_name: str) -> np.ndarray:
+        return np.isin(self.categories, self.tables["category"].matching(lambda value: value == category_name))
+
+    def name_prefix_mask(self, prefix: str) -> np.ndarray:
+        return np.isin(self.names, self.tables["name"].matching(lambda value: value.startswith(prefix)))
+
+    def with_status(self, status: Union[PetStatus, str]) -> "PetBatch":
+        return self[self.status_mask(status)]
+
+    def with_tag(self, tag_name: str) -> "PetBatch":
+        return self[self.tag_mask(tag_name)]
+
+    def with_category(self, category_name: str) -> "PetBatch":
+        return self[self.category_mask(category_name)]
+
+    def status_counts(self) -> Dict[str, int]:
+        """Pets per status, comparable with get_inventory"""
+        return _status_counts(self.statuses, PET_STATUSES)
+
+    # Conversion back to row form
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        names, categories, tags, urls = (self.tables[column].lookup for column in ("name", "category", "tag", "photo_url"))
+        pets = []
+        for index in range(len(self)):
+            pet: Dict[str, Any] = {
+                "name": names(self.names[index]),
+                "photoUrls": [urls(code) for code in self.photo_urls.row(index)],
+            }
+            if self.ids[index] != NO_ID:
+                pet["id"] = int(self.ids[index])
+            category = _without_none(id=_optional_id(self.category_ids[index]),
+                                     name=categories(self.categories[index]))
+            if category:
+                pet["category"] = category
+            tag_codes = self.tags.row(index)
+            if len(tag_codes):
+                pet["tags"] = [
+                    _without_none(id=_optional_id(tag_id), name=tags(code))
+                    for tag_id, code in zip(self.tag_ids.row(index), tag_codes)
+                ]
+            if self.statuses[index] != MISSING:
+                pet["status"] = PET_STATUSES[self.statuses[index]].value
+            pets.append(pet)
+        return pets
+
+    def to_models(self) -> List[Pet]:
+        return [Pet(**pet) for pet in self.to_dicts()]
+
+    def to_json(self) -> bytes:
+        return json.dumps(self.to_dicts()).encode("utf-8")
+
+
+class OrderBatch:
+    """
+    Columnar collection of orders: typed arrays instead of Order instances
+    """
+
+    def __init__(self, ids: np.ndarray, pet_ids: np.ndarray, quantities: np.ndarray,
+                 ship_dates: np.ndarray, statuses: np.ndarray, complete: np.ndarray):
+        self.ids = ids
+        self.pet_ids = pet_ids
+        self.quantities = quantities
+        self.ship_dates = ship_dates
+        self.statuses = statuses
+        self.complete = complete
+
+    @classmethod
+    def from_dicts(cls, orders: Sequence[Dict[str, Any]]) -> "OrderBatch":
+        """Build from API responses, without Order validation"""
+        return cls(
+            ids=_ids(order.get("id") for order in orders),
+            pet_ids=_ids(order.get("petId") for order in orders),
+            quantities=np.fromiter((order.get("quantity") or 0 for order in orders), dtype=np.int32,
+                                   count=len(orders)),
+            ship_dates=np.array([_parse_ship_date(order.get("shipDate")) for order in orders],
+                                dtype="datetime64[ms]"),
+            statuses=_status_codes((order.get("status") for order in orders), ORDER_STATUSES),
+            complete=np.fromiter((bool(order.get("complete")) for order in orders), dtype=bool, count=len(orders))
+        )
+
+    @classmethod
+    def from_models(cls, orders: Sequence[Order]) -> "OrderBatch":
+        return cls.from_dicts([order.dict() for order in orders])
+
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "OrderBatch":
+        return cls.from_dicts(json.loads(data))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, selector: Selector) -> "OrderBatch":
+        """Rows by boolean mask, index array or slice"""
+        return OrderBatch(
+            ids=self.ids[selector],
+            pet_ids=self.pet_ids[selector],
+            quantities=self.quantities[selector],
+            ship_dates=self.ship_dates[selector],
+            statuses=self.statuses[selector],
+            complete=self.complete[selector]
+        )
+
+    # Vectorized filters
+    def status_mask(self, status: Union[OrderStatus, str]) -> np.ndarray:
+        return self.statuses == ORDER_STATUSES.index(OrderStatus(status))
+
+    def with_status(self, status: Union[OrderStatus, str]) -> "OrderBatch":
+        return self[self.status_mask(status)]
+
+    def for_pets(self, pet_ids: Sequence[int]) -> "OrderBatch":
+        return self[np.isin(self.pet_ids, np.asarray(pet_ids, dtype=np.int64))]
+
+    def shipped_between(self, start: datetime, end: datetime) -> "OrderBatch":
+        """Orders with start <= shipDate < end"""
+        return self[(self.ship_dates >= _parse_ship_date(start)) & (self.ship_dates < _parse_ship_date(end))]
+
+    def status_counts(self) -> Dict[str, int]:
+        return _status_counts(self.statuses, ORDER_STATUSES)
+
+    def quantity_by_status(self) -> Dict[str, int]:
+        """Total ordered quantity per status"""
+        known = self.statuses != MISSING
+        totals = np.bincount(self.statuses[known].astype(np.int64), weights=self.quantities[known],
+                             minlength=len(ORDER_STATUSES))
+        return {status.value: int(total) for status, total in zip(ORDER_STATUSES, totals)}
+
+    # Conversion back to row form
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        ship_dates = np.datetime_as_string(self.ship_dates, unit="ms")
+        orders = []
+        for index in range(len(self)):
+            order: Dict[str, Any] = {
+                "petId": _optional_id(self.pet_ids[index]),
+                "quantity": int(self.quantities[index]),
+                "complete": bool(self.complete[index]),
+            }
+            if self.ids[index] != NO_ID:
+                order["id"] = int(self.ids[index])
+            if not np.isnat(self.ship_dates[index]):
+                order["shipDate"] = f"{ship_dates[index]}+0000"
+            if self.statuses[index] != MISSING:
+                order["status"] = ORDER_STATUSES[self.statuses[index]].value
+            orders.append(order)
+        return orders
+
+    def to_models(self) -> List[Order]:
+        orders = self.to_dicts()
+        for order, ship_date in zip(orders, self.ship_dates.astype(datetime)):
+            if ship_date is not None:
+                order["shipDate"] = ship_date.replace(tzinfo=timezone.utc)
+        return [Order(**order) for order in orders]
+
+    def to_json(self) -> bytes:
+        return json.dumps(self.to_dicts()).encode("utf-8")
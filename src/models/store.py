@@ -1,9 +1,6 @@
 from pydantic import BaseModel, Field, validator
 from typing import Optional, Dict, Any
-from datetime
-
-
-import datetime, date
+from datetime import datetime, date
 from enum import Enum
 
 class OrderStatus(str, Enum):
@@ -19,7 +16,7 @@ class Order(BaseModel):
     status: OrderStatus = Field(..., description="Order status")
     complete: bool = Field(False, description="Is order complete")
 
-    'shipDate', pre=True, always=True
+    @validator('shipDate', pre=True, always=True)
     def set_ship_date(cls, v):
         if v is None:
             return datetime.now()
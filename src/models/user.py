@@ -11,7 +11,7 @@ class User(BaseModel):
     phone: Optional[str] = Field(None, description="Phone number")
     userStatus: Optional[int] = Field(0, ge=0, description="User status")
 
-    'username'
+    @validator('username')
     def validate_username(cls, v):
         if not v.strip():
             raise ValueError('Username cannot be empty')
@@ -19,7 +19,7 @@ class User(BaseModel):
             raise ValueError('Username cannot contain spaces')
         return v.strip()
 
-    'phone'
+    @validator('phone')
     def validate_phone(cls, v):
         if v and not v.replace('+', '').replace('-', '').replace(' ', '').replace('(', '').replace(')', '').isdigit():
             raise ValueError('Phone number must contain only digits and valid symbols')
@@ -0,0 +1 @@
+"""Performance tooling for Petstore API tests"""
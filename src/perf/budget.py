@@ -0,0 +1,148 @@
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, Optional, List, Set
+
+from src.api.endpoints import endpoint_template
+from src.perf.histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+ALL_ENDPOINTS = "*"
+BUDGET_KEYS = ("p50_ms", "p90_ms", "p95_ms", "p99_ms", "max_ms")
+
+
+class LatencyRecorder:
+    """
+    Per-endpoint latency histograms of the APIClient calls made by one test
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def record(self, method: str, endpoint: str, seconds: float):
+        """APIClient latency hook; ignores calls while disabled"""
+        if not self.enabled:
+            return
+        for key in (f"{method} {endpoint_template(endpoint)}", ALL_ENDPOINTS):
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Summary per endpoint key, '*' covering all calls"""
+        return {key: histogram.summary() for key, histogram in sorted(self.histograms.items())}
+
+
+class LatencyBudget:
+    """
+    Budget from a latency marker, e.g. latency(p95_ms=300) or
+    latency(endpoint="GET /pet/{pet_id}", p95_ms=200, action="warn")
+    """
+
+    def __init__(self, endpoint: str = ALL_ENDPOINTS, action: str = "fail", **limits: float):
+        unknown = set(limits) - set(BUDGET_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown latency budget keys: {', '.join(sorted(unknown))}")
+        invalid = [key for key, limit in limits.items() if not isinstance(limit, (int, float))]
+        if invalid:
+            raise ValueError(f"Latency budget limits must be numbers: {', '.join(sorted(invalid))}")
+        if action not in ("fail", "warn"):
+            raise ValueError(f"Latency budget action must be 'fail' or 'warn', got {action!r}")
+        self.endpoint = endpoint
+        self.action = action
+        self.limits = limits
+
+    def check(self, recorder: LatencyRecorder) -> List[str]:
+        """Violations of this budget"""
+        histogram = recorder.histograms.get(self.endpoint)
+        if histogram is None:
+            return []
+        summary = histogram.summary()
+        return [
+            f"{self.endpoint} {key[:-3]}={summary[key]:.1f}ms exceeds budget {limit}ms"
+            for key, limit in self.limits.items()
+            if summary[key] > limit
+        ]
+
+
+def budgets_from_markers(markers: Iterable[Any]) -> List[LatencyBudget]:
+    """Budgets of a test's latency markers; ValueError on invalid marker arguments"""
+    budgets = []
+    for marker in markers:
+        if marker.args:
+            raise ValueError(f"Latency marker takes keyword arguments only, got {marker.args!r}")
+        budgets.append(LatencyBudget(**marker.kwargs))
+    return budgets
+
+
+class LatencyBaseline:
+    """
+    Stored per-test, per-endpoint latencies that later runs are compared against
+    """
+
+    COMPARED = ("p50_ms", "p95_ms")
+
+    def __init__(self, path: str, tolerance: float = 0.25, tolerance_ms: float = 20.0):
+        self.path = path
+        self.tolerance = tolerance
+        self.tolerance_ms = tolerance_ms
+        self.data: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self.updated: Set[str] = set()
+        if os.path.exists(path):
+            with open(path) as f:
+                self.data = json.load(f)
+
+    def compare(self, test_id: str, recorder: LatencyRecorder) -> List[str]:
+        """Regressions of a test against its baseline"""
+        regressions = []
+        baseline = self.data.get(test_id, {})
+        for endpoint, summary in recorder.summary().items():
+            expected = baseline.get(endpoint)
+            if expected is None:
+                continue
+            for key in self.COMPARED:
+                allowed = expected[key] * (1 + self.tolerance) + self.tolerance_ms
+                if summary[key] > allowed:
+                    regressions.append(
+                        f"{endpoint} {key[:-3]}={summary[key]:.1f}ms regressed from baseline "
+                        f"{expected[key]:.1f}ms (allowed {allowed:.1f}ms)"
+                    )
+        return regressions
+
+    def update(self, test_id: str, recorder: LatencyRecorder):
+        """Replace the baseline of a test with its measured latencies"""
+        self.data[test_id] = {
+            endpoint: {key: round(summary[key], 3) for key in ("count",) + self.COMPARED}
+            for endpoint, summary in recorder.summary().items()
+        }
+        self.updated.add(test_id)
+
+    def updates(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Baselines replaced in this session, e.g. to send from an xdist worker"""
+        return {test_id: self.data[test_id] for test_id in sorted(self.updated)}
+
+    def merge(self, updates: Dict[str, Dict[str, Dict[str, float]]]):
+        """Apply baselines replaced elsewhere, e.g. by an xdist worker"""
+        self.data.update(updates)
+        self.updated.update(updates)
+
+    def save(self):
+        """Write the baseline file"""
+        with open(self.path, "w") as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+        logger.info(f"Latency baseline written to {self.path}")
+
+
+def evaluate(test_id: str, recorder: LatencyRecorder, budgets: List[LatencyBudget],
+             baseline: Optional[LatencyBaseline] = None, warn_only: bool = False) -> Dict[str, List[str]]:
+    """Split budget violations and baseline regressions into failures and warnings"""
+    result: Dict[str, List[str]] = {"fail": [], "warn": []}
+    for budget in budgets:
+        result["warn" if warn_only else budget.action].extend(budget.check(recorder))
+    if baseline is not None:
+        action = "warn" if warn_only or all(budget.action == "warn" for budget in budgets) else "fail"
+        result[action].extend(baseline.compare(test_id, recorder))
+    return result
@@ -0,0 +1,104 @@
+import math
+from typing import Dict, Any, Optional
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with bounded relative error.
+
+    Bucket boundaries depend only on relative_error, so every reported
+    percentile is within that error of the true sample value, and
+    histograms recorded in different processes merge exactly.
+    """
+
+    MIN_SECONDS = 1e-6
+
+    def __init__(self, relative_error: float = 0.01):
+        self.relative_error = relative_error
+        self._gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, seconds: float):
+        """Record one latency sample in seconds"""
+        index = math.ceil(math.log(max(seconds, self.MIN_SECONDS)) / self._log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def percentile(self, percent: float) -> float:
+        """Latency in seconds at the given percentile (0-100)"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(percent / 100 * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                value = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """Count, mean and percentiles in milliseconds"""
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "min_ms": (self.min or 0.0) * 1000,
+            "p50_ms": self.percentile(50) * 1000,
+            "p90_ms": self.percentile(90) * 1000,
+            "p95_ms": self.percentile(95) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": (self.max or 0.0) * 1000,
+        }
+
+    def reset(self):
+        """Drop all recorded samples"""
+        self.buckets.clear()
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add the samples of another histogram with the same relative_error"""
+        if other.relative_error != self.relative_error:
+            raise ValueError(
+                f"Cannot merge histograms with relative_error {other.relative_error} and {self.relative_error}"
+            )
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON/pickle friendly representation"""
+        return {
+            "relative_error": self.relative_error,
+            "buckets": {str(index): count for index, count in self.buckets.items()},
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """Rebuild a histogram produced by to_dict"""
+        histogram = cls(relative_error=data["relative_error"])
+        histogram.buckets = {int(index): count for index, count in data["buckets"].items()}
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
@@ -0,0 +1,253 @@
+"""
+Multi-process load generator: one APIClient per process, histograms merged exactly.
+
+    python -m src.perf.load --processes 8 --duration 120 --ramp-up 20 --ramp-down 10 --scenario inventory
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from typing import Dict, Any, Optional, List
+
+from src.api.client import APIClient
+from src.api.endpoints import endpoint_template
+from src.perf.histogram import LatencyHistogram
+from src.perf.soak import SCENARIOS
+
+logger = logging.getLogger(__name__)
+
+START_DELAY = 0.5
+RESULT_TIMEOUT = 60.0
+
+
+def inventory_scenario(client: APIClient, iteration: int):
+    """Read-only store inventory lookup"""
+    client.get_inventory()
+
+
+LOAD_SCENARIOS = dict(SCENARIOS, inventory=inventory_scenario)
+
+
+def worker_schedule(worker_id: int, processes: int, start_at: float, ramp_up: float,
+                    duration: float, ramp_down: float) -> Dict[str, float]:
+    """
+    Wall-clock window of one worker. Workers join one by one during ramp-up
+    and leave in reverse order during ramp-down; all run during steady state.
+    """
+    steady_from = start_at + ramp_up
+    steady_until = steady_from + duration
+    return {
+        "active_from": start_at + ramp_up * worker_id / processes,
+        "steady_from": steady_from,
+        "steady_until": steady_until,
+        "active_until": steady_until + ramp_down * (processes - 1 - worker_id) / processes,
+    }
+
+
+def run_worker(worker_id: int, config: Dict[str, Any], ready_barrier, start_event, start_at, results):
+    """Load-generating process: waits for the coordinated start, then loops scenarios"""
+    logging.getLogger("src.api.client").setLevel(logging.WARNING)
+    client = APIClient(base_url=config["base_url"])
+    scenarios = [LOAD_SCENARIOS[name] for name in config["scenarios"]]
+
+    histograms: Dict[str, LatencyHistogram] = {}
+    steady = {"active": False}
+
+    def record(method: str, endpoint: str, seconds: float):
+        if steady["active"]:
+            key = f"{method} {endpoint_template(endpoint)}"
+            histogram = histograms.get(key)
+            if histogram is None:
+                histogram = histograms[key] = LatencyHistogram(config["relative_error"])
+            histogram.record(seconds)
+
+    client.latency_hooks.append(record)
+
+    ready_barrier.wait(timeout=RESULT_TIMEOUT)
+    if not start_event.wait(timeout=RESULT_TIMEOUT):
+        return
+    schedule = worker_schedule(worker_id, config["processes"], start_at.value, config["ramp_up"],
+                               config["duration"], config["ramp_down"])
+    interval = 1.0 / config["rate"] if config["rate"] else 0.0
+
+    iterations = 0
+    steady_iterations = 0
+    errors = 0
+    # Disjoint id ranges so workers never touch each other's users and orders
+    iteration = worker_id * 1_000_000
+
+    now = time.time()
+    if now < schedule["active_from"]:
+        time.sleep(schedule["active_from"] - now)
+    next_tick = time.time()
+
+    while True:
+        now = time.time()
+        if now >= schedule["active_until"]:
+            break
+        steady["active"] = schedule["steady_from"] <= now < schedule["steady_until"]
+        for scenario in scenarios:
+            try:
+                scenario(client, iteration)
+            except Exception as e:
+                errors += 1
+                logger.debug(f"Worker {worker_id}: scenario {scenario.__name__} failed: {e}")
+        iteration += 1
+        iterations += 1
+        if steady["active"]:
+            steady_iterations += 1
+        if interval:
+            next_tick += interval
+            delay = next_tick - time.time()
+            if delay > 0:
+                time.sleep(delay)
+
+    results.put({
+        "worker": worker_id,
+        "iterations": iterations,
+        "steady_iterations": steady_iterations,
+        "errors": errors,
+        "histograms": {key: histogram.to_dict() for key, histogram in histograms.items()},
+    })
+
+
+def merge_results(worker_results: List[Dict[str, Any]], duration: float) -> Dict[str, Any]:
+    """Merge per-worker histograms bucket by bucket into one report"""
+    merged: Dict[str, LatencyHistogram] = {}
+    for result in worker_results:
+        for key, data in result["histograms"].items():
+            histogram = LatencyHistogram.from_dict(data)
+            if key in merged:
+                merged[key].merge(histogram)
+            else:
+                merged[key] = histogram
+
+    overall: Optional[LatencyHistogram] = None
+    for histogram in merged.values():
+        if overall is None:
+            overall = LatencyHistogram(histogram.relative_error)
+        overall.merge(histogram)
+
+    steady_requests = overall.count if overall is not None else 0
+    return {
+        "workers": len(worker_results),
+        "iterations": sum(result["iterations"] for result in worker_results),
+        "errors": sum(result["errors"] for result in worker_results),
+        "steady_rps": steady_requests / duration if duration else 0.0,
+        "overall": overall.summary() if overall is not None else LatencyHistogram().summary(),
+        "endpoints": {key: histogram.summary() for key, histogram in sorted(merged.items())},
+        "histograms": {key: histogram.to_dict() for key, histogram in sorted(merged.items())},
+    }
+
+
+class LoadRunner:
+    """
+    Spawns one load-generating process per core and merges their histograms
+    """
+
+    def __init__(self, scenarios: List[str], processes: Optional[int] = None,
+                 base_url: str = "https://petstore.swagger.io/v2", duration: float = 60.0,
+                 ramp_up: float = 0.0, ramp_down: float = 0.0, rate: float = 0.0,
+                 relative_error: float = 0.01):
+        unknown = [name for name in scenarios if name not in LOAD_SCENARIOS]
+        if unknown:
+            raise ValueError(f"Unknown scenarios: {', '.join(unknown)}")
+        self.config = {
+            "scenarios": scenarios,
+            "processes": processes or os.cpu_count() or 1,
+            "base_url": base_url,
+            "duration": duration,
+            "ramp_up": ramp_up,
+            "ramp_down": ramp_down,
+            "rate": rate,
+            "relative_error": relative_error,
+        }
+
+    def run(self) -> Dict[str, Any]:
+        """Run all workers to completion and return the merged report"""
+        processes = self.config["processes"]
+        context = multiprocessing.get_context("spawn")
+        ready_barrier = context.Barrier(processes + 1)
+        start_event = context.Event()
+        start_at = context.Value("d", 0.0)
+        results = context.Queue()
+
+        workers = [
+            context.Process(
+                target=run_worker,
+                args=(worker_id, self.config, ready_barrier, start_event, start_at, results),
+                name=f"load-worker-{worker_id}"
+            )
+            for worker_id in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+
+        # Every worker has built its client before anyone sends a request
+        try:
+            ready_barrier.wait(timeout=RESULT_TIMEOUT)
+        except threading.BrokenBarrierError:
+            for worker in workers:
+                worker.terminate()
+            raise RuntimeError("Load workers failed to start")
+        start_at.value = time.time() + START_DELAY
+        start_event.set()
+        logger.info(f"Started {processes} load workers")
+
+        worker_results = []
+        expected_end = (start_at.value + self.config["ramp_up"] + self.config["duration"]
+                        + self.config["ramp_down"] + RESULT_TIMEOUT)
+        while len(worker_results) < processes:
+            try:
+                worker_results.append(results.get(timeout=max(expected_end - time.time(), 1.0)))
+            except queue.Empty:
+                logger.error(f"Only {len(worker_results)} of {processes} workers reported results")
+                break
+        for worker in workers:
+            worker.join(timeout=RESULT_TIMEOUT)
+            if worker.is_alive():
+                worker.terminate()
+
+        return merge_results(worker_results, self.config["duration"])
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Generate load against the Petstore API from several processes")
+    parser.add_argument("--processes", type=int, default=os.cpu_count(), help="Worker processes (default: cores)")
+    parser.add_argument("--duration", type=float, default=60, help="Steady state duration in seconds")
+    parser.add_argument("--ramp-up", type=float, default=0, help="Seconds over which workers join")
+    parser.add_argument("--ramp-down", type=float, default=0, help="Seconds over which workers leave")
+    parser.add_argument("--rate", type=float, default=0, help="Iterations per second per worker (0: unbounded)")
+    parser.add_argument("--scenario", action="append", choices=sorted(LOAD_SCENARIOS), help="Scenario to loop")
+    parser.add_argument("--base-url", default="https://petstore.swagger.io/v2")
+    parser.add_argument("--output", default="load.json", help="Merged report output file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    runner = LoadRunner(
+        args.scenario or ["inventory"],
+        processes=args.processes,
+        base_url=args.base_url,
+        duration=args.duration,
+        ramp_up=args.ramp_up,
+        ramp_down=args.ramp_down,
+        rate=args.rate
+    )
+    report = runner.run()
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    overall = report["overall"]
+    logger.info(
+        f"{report['workers']} workers, {report['steady_rps']:.1f} req/s steady, {report['errors']} errors, "
+        f"p50={overall['p50_ms']:.1f}ms p95={overall['p95_ms']:.1f}ms p99={overall['p99_ms']:.1f}ms"
+    )
+    logger.info(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+import http.client
+import json
+import logging
+import random
+import socket
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Callable, Tuple, Sequence, Union
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+LatencyDistribution = Callable[[random.Random], float]
+Responder = Callable[[str, str, Dict[str, str], bytes], Tuple[int, Dict[str, str], bytes]]
+
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailers", "transfer-encoding", "upgrade", "host", "content-length",
+}
+
+
+# Latency distributions, all in milliseconds
+def constant_latency(ms: float) -> LatencyDistribution:
+    return lambda rng: ms
+
+
+def uniform_latency(low_ms: float, high_ms: float) -> LatencyDistribution:
+    return lambda rng: rng.uniform(low_ms, high_ms)
+
+
+def normal_latency(mean_ms: float, stddev_ms: float) -> LatencyDistribution:
+    return lambda rng: max(0.0, rng.gauss(mean_ms, stddev_ms))
+
+
+def lognormal_latency(median_ms: float, sigma: float = 0.5) -> LatencyDistribution:
+    """Long-tailed latency, closest to real WAN round trips"""
+    return lambda rng: median_ms * rng.lognormvariate(0.0, sigma)
+
+
+class NetworkConditions:
+    """
+    Network behaviour emulated by NetworkEmulationProxy.
+
+    Rates are probabilities per request; bandwidth is in bytes per second.
+    """
+
+    def __init__(self, latency: Union[float, LatencyDistribution] = 0.0,
+                 bandwidth_bps: Optional[int] = None,
+                 reset_rate: float = 0.0,
+                 slow_body_rate: float = 0.0,
+                 slow_body_stall_ms: float = 1000.0,
+                 error_rate: float = 0.0,
+                 error_statuses: Sequence[int] = (429, 503),
+                 retry_after: Optional[int] = 1):
+        self.latency = constant_latency(latency) if isinstance(latency, (int, float)) else latency
+        self.bandwidth_bps = bandwidth_bps
+        self.reset_rate = reset_rate
+        self.slow_body_rate = slow_body_rate
+        self.slow_body_stall_ms = slow_body_stall_ms
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.retry_after = retry_after
+
+
+def echo_responder(method: str, path: str, headers: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+    """Offline upstream: echoes JSON request bodies, answers {} otherwise"""
+    return 200, {"Content-Type": "application/json"}, body or b"{}"
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    """Applies the proxy's NetworkConditions to every request"""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, so client-side pooling stays observable
+    # TCP_NODELAY: with Nagle, the body write waits ~40 ms for the ACK of the header write
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.proxy._count("connections")
+        self.upstream_connection: Optional[http.client.HTTPConnection] = None
+
+    def finish(self):
+        try:
+            super().finish()
+        finally:
+            if self.upstream_connection is not None:
+                self.upstream_connection.close()
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_PUT(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+    def _handle(self):
+        proxy: "NetworkEmulationProxy" = self.server.proxy
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        conditions = proxy.conditions
+        with proxy.lock:
+            delay = conditions.latency(proxy.rng) / 1000
+            reset = proxy.rng.random() < conditions.reset_rate
+            error = proxy.rng.random() < conditions.error_rate
+            error_status = proxy.rng.choice(conditions.error_statuses) if error else None
+            slow_body = proxy.rng.random() < conditions.slow_body_rate
+        proxy._count("requests")
+
+        time.sleep(delay)
+
+        if reset:
+            proxy._count("resets")
+            self._reset()
+            return
+
+        if error_status is not None:
+            proxy._count("injected_errors")
+            headers = {"Content-Type": "application/json"}
+            if conditions.retry_after is not None:
+                headers["Retry-After"] = str(conditions.retry_after)
+            payload = json.dumps({"code": error_status, "type": "error", "message": "Injected by proxy"})
+            self._respond(error_status, headers, payload.encode("utf-8"), conditions, slow_body=False)
+            return
+
+        headers = {key: value for key, value in self.headers.items()}
+        try:
+            if proxy.upstream is not None and self.upstream_connection is None:
+                # One upstream connection per client connection, as a pooling client would see
+                self.upstream_connection = proxy.connect_upstream()
+            status, response_headers, payload = proxy.forward(self.command, self.path, headers, body,
+                                                              self.upstream_connection)
+        except (OSError, http.client.HTTPException) as e:
+            logger.warning(f"Upstream request failed: {e}")
+            status, response_headers, payload = 502, {"Content-Type": "text/plain"}, str(e).encode("utf-8")
+        if slow_body:
+            proxy._count("slow_bodies")
+        self._respond(status, response_headers, payload, conditions, slow_body=slow_body)
+
+    def _respond(self, status: int, headers: Dict[str, str], payload: bytes,
+                 conditions: NetworkConditions, slow_body: bool):
+        """Send a response, optionally stalling halfway through the body"""
+        self.send_response(status)
+        for key, value in headers.items():
+            if key.lower() not in HOP_BY_HOP_HEADERS:
+                self.send_header(key, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+
+        if slow_body:
+            half = len(payload) // 2
+            self._write(payload[:half], conditions)
+            time.sleep(conditions.slow_body_stall_ms / 1000)
+            payload = payload[half:]
+        self._write(payload, conditions)
+
+    def _write(self, data: bytes, conditions: NetworkConditions):
+        """Write data, throttled to the bandwidth cap"""
+        if not conditions.bandwidth_bps:
+            self.wfile.write(data)
+            self.wfile.flush()
+            return
+        chunk_size = max(1, conditions.bandwidth_bps // 20)
+        for offset in range(0, len(data), chunk_size):
+            chunk = data[offset:offset + chunk_size]
+            self.wfile.write(chunk)
+            self.wfile.flush()
+            time.sleep(len(chunk) / conditions.bandwidth_bps)
+
+    def _reset(self):
+        """Abort the connection with a TCP RST"""
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        self.connection.close()
+        self.close_connection = True
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class NetworkEmulationProxy:
+    """
+    Local reverse proxy that injects latency, bandwidth caps, connection
+    resets, slow bodies and 429/5xx responses between APIClient and upstream.
+
+    With upstream=None requests are answered by responder, so runs need no network.
+    """
+
+    def __init__(self, upstream: Optional[str] = "https://petstore.swagger.io",
+                 conditions: Optional[NetworkConditions] = None,
+                 responder: Responder = echo_responder,
+                 seed: Optional[int] = 0,
+                 host: str = "127.0.0.1", port: int = 0,
+                 upstream_timeout: float = 30.0):
+        self.upstream = urlsplit(upstream) if upstream else None
+        self.conditions = conditions or NetworkConditions()
+        self.responder = responder
+        self.rng = random.Random(seed)
+        self.upstream_timeout = upstream_timeout
+        self.lock = threading.Lock()
+        self.stats: Dict[str, int] = {"connections": 0, "upstream_connections": 0, "requests": 0, "resets": 0,
+                                      "injected_errors": 0, "slow_bodies": 0}
+
+        self._server = ThreadingHTTPServer((host, port), _ProxyHandler)
+        self._server.daemon_threads = True
+        self._server.proxy = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to point APIClient at, without the API path prefix"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "NetworkEmulationProxy":
+        """Serve on a background thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="network-proxy", daemon=True)
+        self._thread.start()
+        logger.info(f"Network emulation proxy listening on {self.url}")
+        return self
+
+    def stop(self):
+        """Stop serving and close the listening socket"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "NetworkEmulationProxy":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def reset_stats(self):
+        """Zero the connection, request and fault counters"""
+        with self.lock:
+            for key in self.stats:
+                self.stats[key] = 0
+
+    def connect_upstream(self) -> http.client.HTTPConnection:
+        """New keep-alive connection to the upstream host"""
+        self._count("upstream_connections")
+        connection_class = http.client.HTTPSConnection if self.upstream.scheme == "https" else http.client.HTTPConnection
+        return connection_class(self.upstream.netloc, timeout=self.upstream_timeout)
+
+    def forward(self, method: str, path: str, headers: Dict[str, str], body: bytes,
+                connection: Optional[http.client.HTTPConnection] = None) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Send the request upstream, or to the responder when running offline.
+
+        The upstream path is prepended, so upstream="https://host/v2" serves /pet
+        from https://host/v2/pet. A given connection is reused; without one, a
+        connection is opened for this request only.
+        """
+        if self.upstream is None:
+            return self.responder(method, path, headers, body)
+
+        forwarded = {key: value for key, value in headers.items() if key.lower() not in HOP_BY_HOP_HEADERS}
+        target = f"{self.upstream.path.rstrip('/')}{path}"
+        if connection is None:
+            connection = self.connect_upstream()
+            try:
+                return self._send(connection, method, target, forwarded, body)
+            finally:
+                connection.close()
+        try:
+            return self._send(connection, method, target, forwarded, body)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # Upstream closed the idle keep-alive connection; retry once on a fresh one
+            connection.close()
+            return self._send(connection, method, target, forwarded, body)
+
+    @staticmethod
+    def _send(connection: http.client.HTTPConnection, method: str, target: str,
+              headers: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        connection.request(method, target, body=body or None, headers=headers)
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+
+    def _count(self, key: str):
+        with self.lock:
+            self.stats[key] += 1
@@ -0,0 +1,333 @@
+"""
+Soak runner: loops API scenarios for hours and tracks resource growth.
+
+    python -m src.perf.soak --duration 4h --interval 60 --scenario user --scenario store
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import time
+import tracemalloc
+from typing import Dict, Any, Optional, List, Callable
+
+from src.api.client import APIClient
+from src.models.user import User
+from src.models.store import Order
+from src.perf.histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+# Scenarios
+def user_scenario(client: APIClient, iteration: int):
+    """create -> get -> update -> delete flow from tests/test_user.py"""
+    user = User(
+        username=f"soakuser{iteration}",
+        firstName="Soak",
+        lastName="User",
+        email=f"soakuser{iteration}@example.com",
+        password="password123"
+    )
+    client.create_user(user.dict())
+    client.get_user(user.username)
+    updated_data = user.dict()
+    updated_data["firstName"] = "Updated"
+    client.update_user(user.username, updated_data)
+    client.delete_user(user.username)
+
+
+def store_scenario(client: APIClient, iteration: int):
+    """place -> get -> update -> delete flow from tests/test_store.py"""
+    order = Order(
+        id=40000 + iteration,
+        petId=123456789,
+        quantity=1,
+        status="placed"
+    )
+    client.place_order(order.dict())
+    client.get_order(order.id)
+    updated_data = order.dict()
+    updated_data["status"] = "approved"
+    client.place_order(updated_data)
+    client.delete_order(order.id)
+
+
+SCENARIOS: Dict[str, Callable[[APIClient, int], None]] = {
+    "user": user_scenario,
+    "store": store_scenario,
+}
+
+
+class ResourceSampler:
+    """
+    Samples process resources and client state at intervals.
+
+    tracemalloc slows down every allocation, so latencies sampled with
+    trace_allocations=True are not comparable with untraced runs.
+    """
+
+    def __init__(self, client: APIClient, trace_allocations: bool = True):
+        self.client = client
+        self.trace_allocations = trace_allocations
+        self.latency = LatencyHistogram()
+        self.client.latency_hooks.append(lambda method, endpoint, seconds: self.latency.record(seconds))
+        self.started_at = time.monotonic()
+        self.baseline_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started_tracing = False
+
+    def start(self):
+        """Start tracemalloc, if enabled, and take the baseline snapshot"""
+        if not self.trace_allocations:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+            self._started_tracing = True
+        gc.collect()
+        self.baseline_snapshot = tracemalloc.take_snapshot()
+
+    def stop(self):
+        """Stop tracemalloc if this sampler started it"""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def sample(self, iterations: int, errors: int) -> Dict[str, Any]:
+        """Collect one sample; latency percentiles cover the last interval only"""
+        traced_current, traced_peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (None, None)
+        sample = {
+            "elapsed_s": round(time.monotonic() - self.started_at, 3),
+            "iterations": iterations,
+            "errors": errors,
+            "rss_bytes": self._rss_bytes(),
+            "tracemalloc_current_bytes": traced_current,
+            "tracemalloc_peak_bytes": traced_peak,
+            "gc_objects": len(gc.get_objects()),
+            "logging_handlers": self._logging_handlers(),
+        }
+        sample.update(self._open_descriptors())
+        sample.update(self._pool_stats())
+        sample["latency"] = self.latency.summary()
+        self.latency.reset()
+        return sample
+
+    def top_allocations(self, limit: int = 10) -> List[str]:
+        """Allocation sites that grew most since the baseline snapshot"""
+        if self.baseline_snapshot is None or not tracemalloc.is_tracing():
+            return []
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot()
+        return [str(stat) for stat in snapshot.compare_to(self.baseline_snapshot, "lineno")[:limit]]
+
+    @staticmethod
+    def _rss_bytes() -> Optional[int]:
+        """Current resident set size (Linux only)"""
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return None
+
+    @staticmethod
+    def _open_descriptors() -> Dict[str, Optional[int]]:
+        """Open file descriptors and sockets (Linux only)"""
+        try:
+            fds = os.listdir("/proc/self/fd")
+        except OSError:
+            return {"open_fds": None, "open_sockets": None}
+        sockets = 0
+        for fd in fds:
+            try:
+                if os.readlink(f"/proc/self/fd/{fd}").startswith("socket:"):
+                    sockets += 1
+            except OSError:
+                continue
+        return {"open_fds": len(fds), "open_sockets": sockets}
+
+    @staticmethod
+    def _logging_handlers() -> int:
+        """Handlers attached to the root logger and every named logger"""
+        loggers = [logging.getLogger()] + [
+            item for item in logging.Logger.manager.loggerDict.values()
+            if isinstance(item, logging.Logger)
+        ]
+        return sum(len(item.handlers) for item in loggers)
+
+    def _pool_stats(self) -> Dict[str, int]:
+        """urllib3 pools and connections held by the client session"""
+        pools = 0
+        idle_connections = 0
+        opened_connections = 0
+        for adapter in set(self.client.session.adapters.values()):
+            pool_manager = getattr(adapter, "poolmanager", None)
+            if pool_manager is None:
+                continue
+            for key in list(pool_manager.pools.keys()):
+                pool = pool_manager.pools.get(key)
+                if pool is None:
+                    continue
+                pools += 1
+                # The queue is pre-filled with None placeholders up to maxsize
+                idle_connections += sum(conn is not None for conn in list(pool.pool.queue)) if pool.pool is not None else 0
+                opened_connections += pool.num_connections
+        return {
+            "pools": pools,
+            "pool_idle_connections": idle_connections,
+            "pool_opened_connections": opened_connections,
+        }
+
+
+def growth_report(samples: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """First/last values and least-squares slope per hour of every numeric metric"""
+    report: Dict[str, Dict[str, float]] = {}
+    if len(samples) < 2:
+        return report
+
+    flat = [_flatten(sample) for sample in samples]
+    times = [sample["elapsed_s"] / 3600 for sample in flat]
+    mean_t = sum(times) / len(times)
+    var_t = sum((t - mean_t) ** 2 for t in times)
+
+    for metric in flat[0]:
+        if metric == "elapsed_s":
+            continue
+        values = [sample.get(metric) for sample in flat]
+        if any(not isinstance(value, (int, float)) for value in values):
+            continue
+        mean_v = sum(values) / len(values)
+        slope = sum((t - mean_t) * (v - mean_v) for t, v in zip(times, values)) / var_t if var_t else 0.0
+        report[metric] = {
+            "first": values[0],
+            "last": values[-1],
+            "delta": values[-1] - values[0],
+            "slope_per_hour": slope,
+        }
+    return report
+
+
+def _flatten(sample: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested sample dicts into dotted metric names"""
+    flat = {}
+    for key, value in sample.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+class SoakRunner:
+    """
+    Loops scenarios against one long-lived APIClient and writes a time series
+    of resource samples as JSON lines
+    """
+
+    def __init__(self, client: APIClient, scenarios: List[Callable[[APIClient, int], None]],
+                 output_path: str, interval: float = 60.0, pause: float = 0.0,
+                 trace_allocations: bool = True):
+        self.client = client
+        self.scenarios = scenarios
+        self.output_path = output_path
+        self.interval = interval
+        self.pause = pause
+        self.sampler = ResourceSampler(client, trace_allocations=trace_allocations)
+
+    def run(self, duration: float) -> Dict[str, Any]:
+        """Run for duration seconds and return the growth report"""
+        samples: List[Dict[str, Any]] = []
+        iterations = 0
+        errors = 0
+
+        self.sampler.start()
+        try:
+            deadline = time.monotonic() + duration
+            next_sample = time.monotonic() + self.interval
+
+            with open(self.output_path, "w") as f:
+                samples.append(self._write_sample(f, iterations, errors))
+
+                try:
+                    while time.monotonic() < deadline:
+                        for scenario in self.scenarios:
+                            try:
+                                scenario(self.client, iterations)
+                            except Exception as e:
+                                errors += 1
+                                logger.warning(f"Scenario {scenario.__name__} failed: {e}")
+                        iterations += 1
+
+                        if time.monotonic() >= next_sample:
+                            samples.append(self._write_sample(f, iterations, errors))
+                            next_sample += self.interval
+                        if self.pause:
+                            time.sleep(self.pause)
+                except KeyboardInterrupt:
+                    # Ctrl-C is the usual way to end a long soak; still report what ran
+                    logger.warning(f"Soak run interrupted after {iterations} iterations")
+
+                samples.append(self._write_sample(f, iterations, errors))
+
+            report = {
+                "samples": len(samples),
+                "iterations": iterations,
+                "errors": errors,
+                "growth": growth_report(samples),
+                "top_allocations": self.sampler.top_allocations(),
+            }
+        finally:
+            self.sampler.stop()
+
+        report_path = f"{os.path.splitext(self.output_path)[0]}.report.json"
+        with open(report_path, "w") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Soak report written to {report_path}")
+        return report
+
+    def _write_sample(self, f, iterations: int, errors: int) -> Dict[str, Any]:
+        """Take a sample and append it to the time series file"""
+        sample = self.sampler.sample(iterations, errors)
+        f.write(json.dumps(sample) + "\n")
+        f.flush()
+        logger.info(
+            f"Soak sample at {sample['elapsed_s']:.0f}s: rss={sample['rss_bytes']} "
+            f"traced={sample['tracemalloc_current_bytes']} sockets={sample['open_sockets']} "
+            f"p95={sample['latency']['p95_ms']:.1f}ms"
+        )
+        return sample
+
+
+def parse_duration(value: str) -> float:
+    """Parse durations like '90', '15m' or '4h' into seconds"""
+    units = {"s": 1, "m": 60, "h": 3600}
+    if value and value[-1] in units:
+        return float(value[:-1]) * units[value[-1]]
+    return float(value)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Soak Petstore API scenarios and track resource growth")
+    parser.add_argument("--duration", type=parse_duration, default=3600, help="Total run time, e.g. 4h")
+    parser.add_argument("--interval", type=parse_duration, default=60, help="Sampling interval, e.g. 60s")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Scenario to loop")
+    parser.add_argument("--pause", type=float, default=0.0, help="Pause between iterations in seconds")
+    parser.add_argument("--base-url", default="https://petstore.swagger.io/v2")
+    parser.add_argument("--output", default="soak.jsonl", help="Time series output file")
+    parser.add_argument("--no-tracemalloc", action="store_true",
+                        help="Skip allocation tracing, which inflates the sampled latencies")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    # Per-request client logs would dominate both output and memory samples
+    logging.getLogger("src.api.client").setLevel(logging.WARNING)
+
+    scenarios = [SCENARIOS[name] for name in (args.scenario or sorted(SCENARIOS))]
+    runner = SoakRunner(APIClient(base_url=args.base_url), scenarios, args.output,
+                        interval=args.interval, pause=args.pause, trace_allocations=not args.no_tracemalloc)
+    report = runner.run(args.duration)
+    for metric, trend in sorted(report["growth"].items()):
+        logger.info(f"{metric}: {trend['first']} -> {trend['last']} ({trend['slope_per_hour']:+.2f}/h)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 import pytest
 import logging
+from typing import List
 from src.api.client import APIClient
+from src.api.attachments import AllureAttachmentWriter
+from src.perf.budget import LatencyBudget, LatencyBaseline, LatencyRecorder, budgets_from_markers, evaluate
+from src.perf.network import NetworkEmulationProxy
 from src.models.pet import Pet, Category, Tag
 from src.models.user import User
 from src.models.store import Order
@@ -9,10 +13,140 @@ from src.models.store import Order
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+latency_recorder_key = pytest.StashKey[LatencyRecorder]()
+latency_baseline_key = pytest.StashKey[LatencyBaseline]()
+latency_budgets_key = pytest.StashKey[List[LatencyBudget]]()
+
+def pytest_addoption(parser):
+    group = parser.getgroup("latency", "latency budgets")
+    group.addoption("--latency-baseline", default="latency_baseline.json",
+                    help="Baseline file for tests marked with latency")
+    group.addoption("--latency-update-baseline", action="store_true",
+                    help="Store measured latencies as the new baseline")
+    group.addoption("--latency-tolerance", type=float, default=0.25,
+                    help="Allowed relative slowdown against the baseline")
+    group.addoption("--latency-tolerance-ms", type=float, default=20.0,
+                    help="Allowed absolute slowdown against the baseline")
+    group.addoption("--latency-warn-only", action="store_true",
+                    help="Report latency budget violations as warnings")
+
+def pytest_configure(config):
+    config.stash[latency_baseline_key] = LatencyBaseline(
+        config.getoption("latency_baseline"),
+        tolerance=config.getoption("latency_tolerance"),
+        tolerance_ms=config.getoption("latency_tolerance_ms")
+    )
+
+def pytest_sessionfinish(session):
+    if not session.config.getoption("latency_update_baseline"):
+        return
+    baseline = session.config.stash[latency_baseline_key]
+    if hasattr(session.config, "workerinput"):
+        # xdist worker: the controller merges and saves
+        session.config.workeroutput["latency_baseline"] = baseline.updates()
+    else:
+        baseline.save()
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge baselines updated by an xdist worker"""
+    updates = getattr(node, "workeroutput", {}).get("latency_baseline")
+    if updates:
+        node.config.stash[latency_baseline_key].merge(updates)
+
+def pytest_runtest_setup(item):
+    """Validate latency markers before the test runs"""
+    try:
+        item.stash[latency_budgets_key] = budgets_from_markers(item.iter_markers("latency"))
+    except ValueError as e:
+        pytest.fail(f"Invalid latency marker: {e}", pytrace=False)
+
+@pytest.fixture(scope="session")
+def attachment_writer():
+    """Fixture for background Allure writer of request/response traces"""
+    writer = AllureAttachmentWriter()
+    writer.start()
+    yield writer
+    writer.close()
+
+def build_api_client(request, attachment_writer, **kwargs) -> APIClient:
+    """API client wired to trace attachments and latency budgets of the current test"""
+    attachment_writer.begin_test(request.node.nodeid)
+    client = APIClient(attachment_writer=attachment_writer, **kwargs)
+    if request.node.get_closest_marker("latency") is not None:
+        # Enabled only while the test body runs, so fixture calls do not count
+        recorder = request.node.stash.setdefault(latency_recorder_key, LatencyRecorder(enabled=False))
+        client.latency_hooks.append(recorder.record)
+    return client
+
 @pytest.fixture
-def api_client():
+def api_client(request, attachment_writer):
     """Fixture for API client"""
-    return APIClient()
+    return build_api_client(request, attachment_writer)
+
+@pytest.fixture
+def network_proxy():
+    """Fixture for local network-emulation proxy in front of the Petstore API"""
+    with NetworkEmulationProxy(upstream="https://petstore.swagger.io") as proxy:
+        yield proxy
+
+@pytest.fixture
+def offline_proxy():
+    """Fixture for network-emulation proxy answering locally, without network"""
+    with NetworkEmulationProxy(upstream=None) as proxy:
+        yield proxy
+
+@pytest.fixture
+def proxied_api_client(request, attachment_writer):
+    """Fixture for API client routed through network_proxy or offline_proxy"""
+    proxy = request.getfixturevalue("offline_proxy" if "offline_proxy" in request.fixturenames else "network_proxy")
+    return build_api_client(request, attachment_writer, base_url=f"{proxy.url}/v2")
+
+def check_latency(item, report):
+    """Fail or warn on latency budget violations and baseline regressions"""
+    recorder = item.stash.get(latency_recorder_key, None)
+    if recorder is None:
+        return
+    budgets = item.stash.get(latency_budgets_key, [])
+    baseline = item.config.stash[latency_baseline_key]
+    if item.config.getoption("latency_update_baseline"):
+        baseline.update(item.nodeid, recorder)
+        baseline = None
+
+    result = evaluate(item.nodeid, recorder, budgets, baseline,
+                      warn_only=item.config.getoption("latency_warn_only"))
+    report.sections.append(("latency", "\n".join(
+        f"{endpoint}: p50={summary['p50_ms']:.1f}ms p95={summary['p95_ms']:.1f}ms n={summary['count']}"
+        for endpoint, summary in recorder.summary().items()
+    )))
+    for message in result["warn"]:
+        logger.warning(f"Latency: {message}")
+        item.warn(pytest.PytestWarning(f"Latency: {message}"))
+    if result["fail"]:
+        report.outcome = "failed"
+        report.longrepr = "Latency budget exceeded:\n" + "\n".join(result["fail"])
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Record latencies of the calls made inside the test only"""
+    recorder = item.stash.get(latency_recorder_key, None)
+    if recorder is not None:
+        recorder.enabled = True
+    yield
+    if recorder is not None:
+        recorder.enabled = False
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Check latency budgets, then attach buffered API traces to failed tests only"""
+    outcome = yield
+    report = outcome.get_result()
+    if report.when == "call" and report.passed:
+        check_latency(item, report)
+    writer = (getattr(item, "funcargs", None) or {}).get("attachment_writer")
+    if writer is None:
+        return
+    writer.report_phase(item.nodeid, failed=report.failed, finished=report.when == "teardown")
 
 @pytest.fixture
 def sample_pet():
@@ -0,0 +1,142 @@
+import pytest
+import allure
+import requests
+from src.api import attachments
+from src.api.attachments import AllureAttachmentWriter
+from src.perf.network import NetworkConditions
+
+
+@pytest.fixture
+def writer():
+    """Fixture for a started attachment writer"""
+    writer = AllureAttachmentWriter(history_size=3, max_body_bytes=10)
+    writer.start()
+    yield writer
+    writer.close()
+
+
+@pytest.fixture
+def attached(monkeypatch):
+    """Fixture capturing allure.attach calls made by the writer"""
+    calls = []
+    monkeypatch.setattr(attachments.allure, "attach", lambda body, **kwargs: calls.append((body, kwargs)))
+    return calls
+
+
+@allure.epic("Petstore API")
+@allure.feature("Request Traces")
+class TestAllureAttachmentWriter:
+    """Test cases for buffered Allure request/response traces"""
+
+    @allure.title("Ring buffer keeps only the last interactions")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_ring_buffer_limit(self, writer, attached):
+        """Test that only history_size interactions are attached"""
+        writer.begin_test("test_a")
+        for i in range(5):
+            writer.record("GET", f"http://test/pet/{i}")
+        writer.flush("test_a")
+
+        body = attached[0][0]
+        assert "last 3 requests" in attached[0][1]["name"]
+        assert "/pet/0" not in body and "/pet/1" not in body
+        assert all(f"/pet/{i}" in body for i in (2, 3, 4))
+
+    @allure.title("Clients of the same test share its buffer")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_begin_test_keeps_buffer(self, writer, attached):
+        """Test that a second client for the same test does not drop earlier requests"""
+        writer.begin_test("test_a")
+        writer.record("POST", "http://test/pet")
+        writer.begin_test("test_a")
+        writer.record("GET", "http://test/pet/1")
+        writer.flush("test_a")
+
+        assert "POST http://test/pet" in attached[0][0]
+        assert "GET http://test/pet/1" in attached[0][0]
+
+    @allure.title("Request bodies are captured when recorded")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_request_body_snapshot(self, attached):
+        """Test that later changes to the caller's dict do not reach the trace"""
+        writer = AllureAttachmentWriter(max_body_bytes=1024)
+        writer.begin_test("test_a")
+        body = {"id": 1, "name": "Rex"}
+        writer.record("POST", "http://test/pet", body)
+        body["name"] = "Changed"
+        body["status"] = "sold"
+        writer.flush("test_a")
+        writer.close()
+
+        assert '"name": "Rex"' in attached[0][0]
+        assert "Changed" not in attached[0][0] and "sold" not in attached[0][0]
+
+    @allure.title("Large bodies are truncated")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_truncate(self, writer):
+        """Test the body size cap"""
+        assert writer._truncate(b"short") == "short"
+        assert writer._truncate(b"x" * 25) == "x" * 10 + "\n... truncated 15 of 25 bytes"
+
+    @allure.title("Traces are attached once, and only for failed tests")
+    @allure.severity(allure.severity_level.CRITICAL)
+    def test_flush_only_after_failure(self, writer, attached):
+        """Test report_phase for passing and failing tests"""
+        writer.begin_test("test_passed")
+        writer.record("GET", "http://test/store/inventory")
+        for phase in ("setup", "call", "teardown"):
+            writer.report_phase("test_passed", failed=False, finished=phase == "teardown")
+        assert attached == []
+
+        writer.begin_test("test_failed")
+        writer.record("GET", "http://test/store/inventory")
+        writer.report_phase("test_failed", failed=False, finished=False)
+        writer.report_phase("test_failed", failed=True, finished=False)
+        writer.report_phase("test_failed", failed=True, finished=True)
+        assert len(attached) == 1
+
+    @allure.title("Discarded buffers are not attached")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_discard(self, writer, attached):
+        """Test that discard drops the buffer and stops recording"""
+        writer.begin_test("test_a")
+        writer.record("GET", "http://test/store/inventory")
+        writer.discard("test_a")
+        writer.record("GET", "http://test/store/inventory")
+        writer.flush("test_a")
+
+        assert attached == []
+        assert writer._current_test is None
+
+    @allure.title("Failing hooks do not change the request outcome")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_failing_hooks_are_isolated(self, offline_proxy, proxied_api_client, monkeypatch):
+        """Test that writer and latency hook errors are only logged"""
+        def broken(*args, **kwargs):
+            raise RuntimeError("broken hook")
+
+        monkeypatch.setattr(proxied_api_client.attachment_writer, "record", broken)
+        proxied_api_client.latency_hooks.append(broken)
+
+        with allure.step("Successful request still returns its body"):
+            assert proxied_api_client.add_pet({"id": 1, "name": "Rex"}) == {"id": 1, "name": "Rex"}
+
+        with allure.step("Failed request still raises the HTTP error"):
+            offline_proxy.conditions = NetworkConditions(error_rate=1.0, error_statuses=(404,))
+            with pytest.raises(requests.exceptions.HTTPError):
+                proxied_api_client.get_inventory()
+
+    @allure.title("Requests and latency hooks use endpoint paths")
+    @allure.severity(allure.severity_level.CRITICAL)
+    def test_endpoint_paths(self, offline_proxy, proxied_api_client):
+        """Test that endpoints are formatted by value, not by enum name"""
+        paths = []
+        endpoints = []
+        offline_proxy.responder = lambda method, path, headers, body: (paths.append(path) or (200, {}, b"[]"))
+        proxied_api_client.latency_hooks.append(lambda method, endpoint, seconds: endpoints.append(endpoint))
+
+        proxied_api_client.find_pets_by_status("available")
+        proxied_api_client.get_inventory()
+
+        assert paths == ["/v2/pet/findByStatus?status=available", "/v2/store/inventory"]
+        assert endpoints == ["/pet/findByStatus?status=available", "/store/inventory"]
@@ -0,0 +1,121 @@
+import pytest
+import allure
+import json
+import time
+import numpy as np
+from datetime import datetime, timezone
+from src.models.batch import PetBatch, OrderBatch
+from src.models.store import Order
+
+
+@pytest.fixture
+def pet_dicts():
+    """Fixture for pets as returned by find_pets_by_status"""
+    return [
+        {
+            "id": 1,
+            "category": {"id": 1, "name": "Dogs"},
+            "name": "Rex",
+            "photoUrls": ["http://test.com/rex.jpg"],
+            "tags": [{"id": 1, "name": "friendly"}, {"id": 2, "name": "trained"}],
+            "status": "available"
+        },
+        {
+            "id": 2,
+            "category": {"id": 2, "name": "Cats"},
+            "name": "Tom",
+            "photoUrls": ["http://test.com/tom.jpg"],
+            "tags": [{"id": 1, "name": "friendly"}],
+            "status": "sold"
+        },
+        {
+            "id": 3,
+            "name": "Rocky",
+            "photoUrls": [],
+            "status": "available"
+        },
+    ]
+
+
+@pytest.fixture
+def new_york_time(monkeypatch):
+    """Fixture switching local time to UTC-5 in winter"""
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is not available on this platform")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@allure.epic("Petstore API")
+@allure.feature("Batch Containers")
+class TestBatchContainers:
+    """Test cases for columnar Pet and Order batches"""
+
+    @allure.title("Filter pets by tag, category, name prefix and status")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_pet_filters(self, pet_dicts):
+        """Test vectorized pet filters"""
+        batch = PetBatch.from_dicts(pet_dicts)
+
+        with allure.step("Verify filters"):
+            assert batch.with_tag("friendly").ids.tolist() == [1, 2]
+            assert batch.with_category("Dogs").ids.tolist() == [1]
+            assert batch[batch.name_prefix_mask("Ro")].ids.tolist() == [3]
+            assert batch.with_status("available").with_tag("friendly").ids.tolist() == [1]
+            assert batch.status_counts() == {"available": 2, "pending": 0, "sold": 1}
+
+    @allure.title("Pet batch round-trips through JSON bytes and models")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_pet_round_trip(self, pet_dicts, complex_pet):
+        """Test conversion back to dicts and models"""
+        batch = PetBatch.from_json(json.dumps(pet_dicts).encode("utf-8"))
+        assert json.loads(batch.to_json()) == pet_dicts
+
+        models = PetBatch.from_models([complex_pet]).to_models()
+        assert models[0] == complex_pet
+
+    @allure.title("Aggregate orders by status")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_order_aggregation(self):
+        """Test order filters and group-by-status totals"""
+        orders = [
+            {"id": 1, "petId": 10, "quantity": 2, "shipDate": "2023-12-01T12:00:00.000+0000",
+             "status": "placed", "complete": False},
+            {"id": 2, "petId": 11, "quantity": 5, "status": "delivered", "complete": True},
+            {"id": 3, "petId": 10, "quantity": 1, "status": "placed", "complete": False},
+        ]
+        batch = OrderBatch.from_dicts(orders)
+
+        with allure.step("Verify aggregation"):
+            assert batch.status_counts() == {"placed": 2, "approved": 0, "delivered": 1}
+            assert batch.quantity_by_status() == {"placed": 3, "approved": 0, "delivered": 5}
+            assert batch.for_pets([10]).ids.tolist() == [1, 3]
+
+        with allure.step("Verify round trip"):
+            assert batch.to_dicts() == orders
+
+    @allure.title("Order batch round-trips through models")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_order_round_trip(self, new_york_time):
+        """Test that naive ship dates are taken as local time and aware ones keep their instant"""
+        orders = [
+            Order(id=1, petId=10, quantity=2, shipDate=datetime(2023, 12, 1, 12, 0), status="placed"),
+            Order(id=2, petId=11, quantity=5, shipDate=datetime(2023, 12, 1, 12, 0, tzinfo=timezone.utc),
+                  status="delivered", complete=True),
+        ]
+        batch = OrderBatch.from_models(orders)
+
+        with allure.step("Verify ship dates are stored as UTC"):
+            assert batch.ship_dates.tolist() == [
+                np.datetime64("2023-12-01T17:00", "ms").item(),
+                np.datetime64("2023-12-01T12:00", "ms").item(),
+            ]
+
+        with allure.step("Verify round trip"):
+            models = batch.to_models()
+            for model, order in zip(models, orders):
+                assert model.shipDate == order.shipDate.astimezone(timezone.utc)
+                assert model.dict(exclude={"shipDate"}) == order.dict(exclude={"shipDate"})
@@ -0,0 +1,153 @@
+import pytest
+import allure
+import json
+from src.perf.budget import ALL_ENDPOINTS, LatencyBaseline, LatencyBudget, LatencyRecorder, budgets_from_markers, evaluate
+from src.perf.network import NetworkConditions, constant_latency
+
+
+@pytest.fixture
+def recorder():
+    """Fixture for a recorder holding ten 100 ms inventory calls"""
+    recorder = LatencyRecorder()
+    for _ in range(10):
+        recorder.record("GET", "/store/inventory", 0.1)
+    return recorder
+
+
+@pytest.fixture
+def baseline(tmp_path):
+    """Fixture for a baseline of 70 ms inventory calls"""
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps({"test_a": {"GET /store/inventory": {"count": 10, "p50_ms": 70.0, "p95_ms": 70.0}}}))
+    return LatencyBaseline(str(path), tolerance=0.25, tolerance_ms=20)
+
+
+@pytest.fixture
+def inventory_checked(proxied_api_client):
+    """Fixture that calls the API during setup and teardown"""
+    proxied_api_client.get_inventory()
+    yield
+    proxied_api_client.get_inventory()
+
+
+@allure.epic("Petstore API")
+@allure.feature("Latency Budgets")
+class TestLatencyBudgets:
+    """Test cases for latency budgets and baselines"""
+
+    @allure.title("Invalid budgets are rejected")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.parametrize("marker", [
+        pytest.mark.latency(p95=300),
+        pytest.mark.latency(p95_ms="300"),
+        pytest.mark.latency(p95_ms=300, action="skip"),
+        pytest.mark.latency(300),
+    ])
+    def test_invalid_budget(self, marker):
+        """Test validation of latency marker arguments"""
+        with pytest.raises(ValueError):
+            budgets_from_markers([marker.mark])
+
+    @allure.title("Budgets are built from markers")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_budgets_from_markers(self):
+        """Test endpoint, action and limits of a marker budget"""
+        marker = pytest.mark.latency(endpoint="GET /pet/{pet_id}", p95_ms=200, action="warn").mark
+        budget, = budgets_from_markers([marker])
+
+        assert budget.endpoint == "GET /pet/{pet_id}"
+        assert budget.action == "warn"
+        assert budget.limits == {"p95_ms": 200}
+
+    @allure.title("Budget check reports exceeded limits only")
+    @allure.severity(allure.severity_level.CRITICAL)
+    def test_check(self, recorder):
+        """Test budget violations per endpoint"""
+        recorder.enabled = False
+        recorder.record("GET", "/store/inventory", 10.0)
+
+        assert list(recorder.histograms) == ["GET /store/inventory", ALL_ENDPOINTS]
+        assert LatencyBudget(p95_ms=500, max_ms=500).check(recorder) == []
+        assert len(LatencyBudget(p50_ms=50, p95_ms=50).check(recorder)) == 2
+        assert len(LatencyBudget(endpoint="GET /store/inventory", p95_ms=50).check(recorder)) == 1
+        assert LatencyBudget(endpoint="GET /pet/{pet_id}", p95_ms=50).check(recorder) == []
+
+    @allure.title("Baseline comparison applies relative and absolute tolerance")
+    @allure.severity(allure.severity_level.CRITICAL)
+    def test_compare(self, recorder, baseline):
+        """Test tolerance math: 70 ms allows 70 * 1.25 + 20 = 107.5 ms"""
+        assert baseline.compare("test_a", recorder) == []
+        assert baseline.compare("test_unknown", recorder) == []
+
+        baseline.tolerance_ms = 0
+        regressions = baseline.compare("test_a", recorder)
+        assert len(regressions) == 2
+        assert "allowed 87.5ms" in regressions[0]
+
+    @allure.title("Updated baselines are saved and merged")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_update_and_save(self, recorder, baseline):
+        """Test update, save, reload and merge of worker updates"""
+        with allure.step("Update and save"):
+            baseline.update("test_b", recorder)
+            baseline.save()
+            reloaded = LatencyBaseline(baseline.path)
+            assert set(reloaded.data) == {"test_a", "test_b"}
+            assert reloaded.data["test_b"]["GET /store/inventory"]["count"] == 10
+            assert reloaded.data["test_b"]["GET /store/inventory"]["p95_ms"] == pytest.approx(100, rel=0.02)
+
+        with allure.step("Only updated tests are sent from workers"):
+            assert list(baseline.updates()) == ["test_b"]
+            reloaded.merge(baseline.updates())
+            assert reloaded.updated == {"test_b"}
+
+    @allure.title("Violations are split into failures and warnings")
+    @allure.severity(allure.severity_level.CRITICAL)
+    def test_evaluate(self, recorder, baseline):
+        """Test budget actions, warn-only mode and baseline regressions"""
+        fail = LatencyBudget(p95_ms=50)
+        warn = LatencyBudget(p95_ms=50, action="warn")
+        baseline.tolerance_ms = 0
+
+        result = evaluate("test_a", recorder, [fail, warn])
+        assert (len(result["fail"]), len(result["warn"])) == (1, 1)
+
+        result = evaluate("test_a", recorder, [fail], baseline)
+        assert (len(result["fail"]), len(result["warn"])) == (3, 0)
+
+        result = evaluate("test_a", recorder, [warn], baseline)
+        assert (len(result["fail"]), len(result["warn"])) == (0, 3)
+
+        result = evaluate("test_a", recorder, [fail], baseline, warn_only=True)
+        assert (len(result["fail"]), len(result["warn"])) == (0, 3)
+
+    @allure.title("Injected latency exceeds the budget")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_injected_latency_budget(self, offline_proxy, proxied_api_client):
+        """Test budgets against latency injected by the offline proxy"""
+        recorder = LatencyRecorder()
+        proxied_api_client.latency_hooks.append(recorder.record)
+        offline_proxy.conditions = NetworkConditions(latency=constant_latency(100))
+
+        with allure.step("Make requests"):
+            for _ in range(3):
+                proxied_api_client.get_inventory()
+
+        with allure.step("Verify budget violation"):
+            assert recorder.summary()[ALL_ENDPOINTS]["count"] == 3
+            assert LatencyBudget(p50_ms=1000).check(recorder) == []
+            assert len(evaluate("test_c", recorder, [LatencyBudget(p50_ms=50)])["fail"]) == 1
+
+    @allure.title("Latency marker on an offline test")
+    @allure.severity(allure.severity_level.MINOR)
+    @pytest.mark.latency(p95_ms=1000)
+    def test_latency_marker(self, offline_proxy, proxied_api_client, inventory_checked):
+        """Test that a marked test records the calls made inside the test only"""
+        recorder, = [hook.__self__ for hook in proxied_api_client.latency_hooks
+                     if isinstance(getattr(hook, "__self__", None), LatencyRecorder)]
+
+        for _ in range(3):
+            proxied_api_client.get_inventory()
+
+        assert offline_proxy.stats["requests"] == 4
+        assert recorder.summary()[ALL_ENDPOINTS]["count"] == 3
@@ -0,0 +1,54 @@
+import pytest
+import allure
+import random
+from src.perf.histogram import LatencyHistogram
+
+
+@allure.epic("Petstore API")
+@allure.feature("Performance Tooling")
+class TestLatencyHistogram:
+    """Test cases for mergeable latency histograms"""
+
+    @allure.title("Merged histograms equal a single histogram")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_merge_is_exact(self):
+        """Test that merging per-process histograms loses nothing"""
+        samples = [random.lognormvariate(-3, 1) for _ in range(5000)]
+
+        with allure.step("Record samples into one and into four histograms"):
+            single = LatencyHistogram()
+            parts = [LatencyHistogram() for _ in range(4)]
+            for i, sample in enumerate(samples):
+                single.record(sample)
+                parts[i % 4].record(sample)
+
+        with allure.step("Merge serialized parts"):
+            merged = LatencyHistogram()
+            for part in parts:
+                merged.merge(LatencyHistogram.from_dict(part.to_dict()))
+
+        with allure.step("Verify merged percentiles"):
+            assert merged.buckets == single.buckets
+            assert merged.count == single.count
+            for percent in (50, 90, 95, 99):
+                assert merged.percentile(percent) == single.percentile(percent)
+
+    @allure.title("Percentiles stay within relative error")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.parametrize("percent", [50, 95, 99])
+    def test_percentile_accuracy(self, percent):
+        """Test percentile error bound"""
+        samples = sorted(random.expovariate(10) for _ in range(10000))
+        histogram = LatencyHistogram(relative_error=0.01)
+        for sample in samples:
+            histogram.record(sample)
+
+        expected = samples[max(0, int(percent / 100 * len(samples)) - 1)]
+        assert abs(histogram.percentile(percent) - expected) <= expected * 0.01 + 1e-9
+
+    @allure.title("Merging histograms with different precision fails")
+    @allure.severity(allure.severity_level.MINOR)
+    def test_merge_rejects_different_precision(self):
+        """Test that incompatible bucket layouts are not merged"""
+        with pytest.raises(ValueError):
+            LatencyHistogram(0.01).merge(LatencyHistogram(0.02))
@@ -0,0 +1,104 @@
+import pytest
+import allure
+from src.api.endpoints import endpoint_template
+from src.perf.histogram import LatencyHistogram
+from src.perf.load import LoadRunner, merge_results, worker_schedule
+
+
+def worker_result(latencies, iterations=10, errors=0):
+    """Build a worker result as put on the results queue by run_worker"""
+    histograms = {}
+    for key, seconds in latencies.items():
+        histogram = LatencyHistogram()
+        for value in seconds:
+            histogram.record(value)
+        histograms[key] = histogram.to_dict()
+    return {"worker": 0, "iterations": iterations, "steady_iterations": iterations, "errors": errors,
+            "histograms": histograms}
+
+
+@allure.epic("Petstore API")
+@allure.feature("Performance Tooling")
+class TestLoadRunner:
+    """Test cases for the multi-process load generator"""
+
+    @allure.title("Workers join and leave in ramp order")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_worker_schedule(self):
+        """Test ramp-up and ramp-down windows"""
+        schedules = [worker_schedule(worker_id, 4, 100.0, 8.0, 60.0, 4.0) for worker_id in range(4)]
+
+        assert [s["active_from"] for s in schedules] == [100.0, 102.0, 104.0, 106.0]
+        assert [s["active_until"] for s in schedules] == [171.0, 170.0, 169.0, 168.0]
+        assert all(s["steady_from"] == 108.0 and s["steady_until"] == 168.0 for s in schedules)
+
+    @allure.title("Worker histograms are merged per endpoint")
+    @allure.severity(allure.severity_level.CRITICAL)
+    def test_merge_results(self):
+        """Test per-endpoint merge, totals and steady throughput"""
+        results = [
+            worker_result({"GET /store/inventory": [0.01, 0.02], "GET /pet/{pet_id}": [0.1]}, errors=1),
+            worker_result({"GET /store/inventory": [0.03]}, iterations=5),
+        ]
+        report = merge_results(results, duration=2.0)
+
+        with allure.step("Verify totals"):
+            assert report["workers"] == 2
+            assert report["iterations"] == 15
+            assert report["errors"] == 1
+            assert report["steady_rps"] == 2.0
+
+        with allure.step("Verify per-endpoint histograms"):
+            assert list(report["endpoints"]) == ["GET /pet/{pet_id}", "GET /store/inventory"]
+            assert report["endpoints"]["GET /store/inventory"]["count"] == 3
+            assert report["overall"]["count"] == 4
+            assert report["overall"]["max_ms"] == pytest.approx(100, rel=0.02)
+            assert LatencyHistogram.from_dict(report["histograms"]["GET /store/inventory"]).count == 3
+
+    @allure.title("Merging no results gives an empty report")
+    @allure.severity(allure.severity_level.MINOR)
+    def test_merge_empty_results(self):
+        """Test the path where no worker reported"""
+        report = merge_results([], duration=0)
+
+        assert report["workers"] == 0
+        assert report["steady_rps"] == 0.0
+        assert report["overall"]["count"] == 0
+        assert report["endpoints"] == {}
+
+    @allure.title("Request paths map to endpoint templates")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.parametrize("path, template", [
+        ("/pet/findByStatus?status=available", "/pet/findByStatus"),
+        ("/pet/42", "/pet/{pet_id}"),
+        ("/pet/42/uploadImage", "/pet/{pet_id}/uploadImage"),
+        ("/user/login?username=a&password=b", "/user/login"),
+        ("/user/testuser", "/user/{username}"),
+        ("/unknown/path?x=1", "/unknown/path"),
+    ])
+    def test_endpoint_template(self, path, template):
+        """Test literal endpoints win over templates and query strings are stripped"""
+        assert endpoint_template(path) == template
+
+    @allure.title("Two workers run against the offline proxy")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_load_run(self, offline_proxy):
+        """Test a short two-process run end to end"""
+        runner = LoadRunner(["inventory"], processes=2, base_url=f"{offline_proxy.url}/v2", duration=1, rate=20)
+
+        with allure.step("Run load"):
+            report = runner.run()
+
+        with allure.step("Verify merged report"):
+            assert report["workers"] == 2
+            assert report["errors"] == 0
+            assert report["overall"]["count"] > 0
+            assert report["steady_rps"] == report["overall"]["count"]
+            assert offline_proxy.stats["requests"] >= report["overall"]["count"]
+
+    @allure.title("Unknown scenarios are rejected")
+    @allure.severity(allure.severity_level.MINOR)
+    def test_unknown_scenario(self):
+        """Test scenario validation"""
+        with pytest.raises(ValueError):
+            LoadRunner(["missing"])
@@ -0,0 +1,151 @@
+import pytest
+import allure
+import time
+import statistics
+import threading
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.api.client import APIClient
+from src.perf.network import NetworkConditions, NetworkEmulationProxy, constant_latency
+
+
+class _DirectHandler(BaseHTTPRequestHandler):
+    """Keep-alive server answering {} in a single write, unaffected by Nagle's algorithm"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.wfile.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 2\r\n\r\n{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def direct_server():
+    """Fixture for a local server to compare proxied latencies against"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _DirectHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}"
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@allure.epic("Petstore API")
+@allure.feature("Network Emulation")
+class TestNetworkEmulation:
+    """Test cases for APIClient behaviour under emulated network conditions"""
+
+    @allure.title("Keep-alive connection is reused")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_connection_pooling(self, offline_proxy, proxied_api_client):
+        """Test that consecutive calls share one pooled connection"""
+        with allure.step("Make several requests"):
+            for _ in range(3):
+                proxied_api_client.get_inventory()
+
+        with allure.step("Verify a single connection was opened"):
+            assert offline_proxy.stats["requests"] == 3
+            assert offline_proxy.stats["connections"] == 1
+
+    @allure.title("Injected latency is observed by the client")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_injected_latency(self, offline_proxy, proxied_api_client):
+        """Test latency injection"""
+        offline_proxy.conditions = NetworkConditions(latency=constant_latency(200))
+
+        with allure.step("Measure request duration"):
+            start = time.perf_counter()
+            proxied_api_client.get_inventory()
+            elapsed = time.perf_counter() - start
+
+        with allure.step("Verify delay"):
+            assert elapsed >= 0.2
+
+    @allure.title("Proxy without conditions adds no measurable latency")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_zero_latency_overhead(self, offline_proxy, proxied_api_client, direct_server):
+        """Test that the proxy adds only a few ms over a direct call, i.e. no Nagle delay"""
+        def median_duration(client):
+            client.add_pet({"id": 1, "name": "Rex"})  # warm up the pooled connection
+            durations = []
+            for _ in range(10):
+                start = time.perf_counter()
+                client.add_pet({"id": 1, "name": "Rex"})
+                durations.append(time.perf_counter() - start)
+            return statistics.median(durations)
+
+        with allure.step("Measure direct and proxied requests"):
+            direct = median_duration(APIClient(base_url=direct_server))
+            proxied = median_duration(proxied_api_client)
+
+        with allure.step("Verify overhead"):
+            assert proxied - direct < 0.02
+
+    @allure.title("Upstream connection is reused and keeps its path")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_upstream_connection_reuse(self):
+        """Test one upstream connection per client connection and the upstream path prefix"""
+        paths = []
+
+        def responder(method, path, headers, body):
+            paths.append(path)
+            return 200, {"Content-Type": "application/json"}, b"{}"
+
+        with NetworkEmulationProxy(upstream=None, responder=responder) as upstream:
+            with NetworkEmulationProxy(upstream=f"{upstream.url}/v2") as proxy:
+                client = APIClient(base_url=proxy.url)
+                for _ in range(3):
+                    client.get_inventory()
+
+                with allure.step("Verify pooled upstream connection"):
+                    assert proxy.stats["upstream_connections"] == 1
+                    assert upstream.stats["connections"] == 1
+
+        with allure.step("Verify forwarded paths"):
+            assert paths == ["/v2/store/inventory"] * 3
+
+    @allure.title("429 with Retry-After is retried")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_retry_after_is_retried(self, offline_proxy, proxied_api_client):
+        """Test that rate-limited requests go through the retry strategy"""
+        offline_proxy.conditions = NetworkConditions(error_rate=1.0, error_statuses=(429,), retry_after=1)
+
+        with allure.step("Request against a rate-limited upstream"):
+            with pytest.raises(requests.exceptions.RequestException):
+                proxied_api_client.get_inventory()
+
+        with allure.step("Verify initial attempt plus three retries"):
+            assert offline_proxy.stats["injected_errors"] == 4
+
+    @allure.title("Connection reset surfaces as connection error")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_connection_reset(self, offline_proxy, proxied_api_client):
+        """Test that resets are retried and then raised"""
+        offline_proxy.conditions = NetworkConditions(reset_rate=1.0)
+
+        with allure.step("Request against a resetting upstream"):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                proxied_api_client.get_inventory()
+
+        with allure.step("Verify resets were retried"):
+            assert offline_proxy.stats["resets"] == 4
+
+    @allure.title("Slow body exceeds client read timeout")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_slow_body_timeout(self, offline_proxy, proxied_api_client):
+        """Test that a stalled response body hits the read timeout"""
+        offline_proxy.conditions = NetworkConditions(slow_body_rate=1.0, slow_body_stall_ms=1000)
+        proxied_api_client.timeout = 0.3
+
+        with allure.step("Request with a stalled body"):
+            with pytest.raises((requests.exceptions.ReadTimeout, requests.exceptions.ConnectionError)):
+                proxied_api_client.add_pet({"id": 1, "name": "Slow", "photoUrls": ["http://test.com/slow.jpg"]})
+
+        with allure.step("Verify the body was stalled"):
+            assert offline_proxy.stats["slow_bodies"] == 1
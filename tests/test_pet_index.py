@@ -0,0 +1,197 @@
+import pytest
+import allure
+import logging
+from src.api.pet_index import PetIndex
+
+logger = logging.getLogger(__name__)
+
+
+class StubClient:
+    """Offline stand-in for APIClient serving fixed status listings"""
+
+    def __init__(self, listings):
+        self.listings = listings
+        self.fetches = []
+        self.pet_index = None
+        self.during_fetch = None
+
+    def find_pets_by_status(self, status):
+        self.fetches.append(status)
+        listing = [dict(pet) for pet in self.listings.get(status, [])]
+        if self.during_fetch is not None:
+            self.during_fetch()
+        return listing
+
+
+def pet(pet_id, name, status="available", tags=(), category=None):
+    """Pet dict as returned by find_pets_by_status"""
+    data = {"id": pet_id, "name": name, "photoUrls": [], "status": status,
+            "tags": [{"id": i, "name": tag} for i, tag in enumerate(tags)]}
+    if category is not None:
+        data["category"] = {"id": 1, "name": category}
+    return data
+
+
+@pytest.fixture
+def stub_client():
+    """Fixture for a stub client with available and sold listings"""
+    return StubClient({
+        "available": [pet(1, "Rex", tags=["friendly"], category="Dogs"), pet(2, "Rocky", category="Dogs")],
+        "sold": [pet(3, "Tom", status="sold", tags=["friendly"], category="Cats")],
+    })
+
+
+@pytest.fixture
+def indexed_complex_pet(api_client, complex_pet):
+    """Fixture that deletes complex_pet after test"""
+    yield complex_pet
+
+    # Teardown
+    try:
+        api_client.delete_pet(complex_pet.id)
+        logger.info(f"Cleaned up pet with ID: {complex_pet.id}")
+    except Exception as e:
+        logger.warning(f"Failed to cleanup pet {complex_pet.id}: {e}")
+
+
+@allure.epic("Petstore API")
+@allure.feature("Pet Management")
+class TestPetIndex:
+    """Test cases for the client-side pet index"""
+
+    @allure.title("Index follows the client's own pet writes")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.regression
+    def test_index_tracks_client_writes(self, api_client, indexed_complex_pet):
+        """Test lookups by tag, category and name prefix after add, update and delete"""
+        complex_pet = indexed_complex_pet
+        index = PetIndex(api_client, statuses=["available", "sold"])
+
+        with allure.step("Add pet"):
+            api_client.add_pet(complex_pet.dict())
+
+        with allure.step("Find pet by tag, category and name prefix"):
+            found = index.find(status="available", tags=["friendly", "trained"], category="Dogs",
+                               name_prefix="Complex")
+            assert complex_pet.id in [pet["id"] for pet in found]
+
+        with allure.step("Update pet status"):
+            updated_data = complex_pet.dict()
+            updated_data["status"] = "sold"
+            api_client.update_pet(updated_data)
+            assert index.get(complex_pet.id)["status"] == "sold"
+            assert complex_pet.id in index.by_status["sold"]
+
+        with allure.step("Delete pet"):
+            api_client.delete_pet(complex_pet.id)
+            assert index.get(complex_pet.id) is None
+            assert complex_pet.id not in [pet["id"] for pet in index.find_by_category("Dogs", status="sold")]
+
+    @allure.title("Lookups combine tag, category and name prefix")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_lookups(self, stub_client):
+        """Test secondary index lookups on stub listings"""
+        index = PetIndex(stub_client, statuses=["available", "sold"])
+
+        assert [p["id"] for p in index.find_by_tag("friendly")] == [1, 3]
+        assert [p["id"] for p in index.find_by_category("Dogs")] == [1, 2]
+        assert [p["id"] for p in index.find_by_name_prefix("Ro")] == [2]
+        assert [p["id"] for p in index.find(status="available", tags=["friendly"], category="Dogs")] == [1]
+        assert index.to_batch(status="sold").ids.tolist() == [3]
+
+    @allure.title("Only the requested statuses are fetched, once per max_age")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_refresh_per_status(self, stub_client):
+        """Test incremental per-status fetches and max_age staleness"""
+        index = PetIndex(stub_client, max_age=60, statuses=["available", "sold"])
+
+        with allure.step("First lookup fetches only its status"):
+            index.find_by_tag("friendly", status="sold")
+            assert stub_client.fetches == ["sold"]
+
+        with allure.step("Fresh listings are not fetched again"):
+            index.find_by_tag("friendly")
+            index.find_by_tag("friendly")
+            assert stub_client.fetches == ["sold", "available"]
+
+        with allure.step("Listings older than max_age are fetched again"):
+            index._fetched_at["sold"] -= 61
+            assert index.is_stale("sold") and not index.is_stale("available")
+            index.find_by_tag("friendly")
+            assert stub_client.fetches == ["sold", "available", "sold"]
+
+    @allure.title("Invalidated listings are fetched again")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_invalidate(self, stub_client):
+        """Test invalidating one and all statuses"""
+        index = PetIndex(stub_client, statuses=["available", "sold"])
+        index.refresh()
+
+        index.invalidate("sold")
+        index.refresh()
+        assert stub_client.fetches == ["available", "sold", "sold"]
+
+        index.invalidate()
+        index.refresh()
+        assert stub_client.fetches == ["available", "sold", "sold", "available", "sold"]
+
+    @allure.title("Delisted pets are dropped on refresh")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_delisted_pets_are_dropped(self, stub_client):
+        """Test that a refetch removes pets missing from the listing"""
+        index = PetIndex(stub_client, statuses=["available"])
+        index.refresh()
+
+        stub_client.listings["available"] = [pet(2, "Rocky", category="Dogs")]
+        index.refresh(force=True)
+
+        assert index.get(1) is None
+        assert [p["id"] for p in index.find_by_category("Dogs")] == [2]
+        assert index.find_by_tag("friendly") == []
+        assert index.find_by_name_prefix("Rex") == []
+
+    @allure.title("Writes made during a fetch survive the refresh")
+    @allure.severity(allure.severity_level.CRITICAL)
+    def test_writes_during_fetch_are_kept(self, stub_client):
+        """Test that a stale listing neither drops nor overwrites newer client writes"""
+        index = PetIndex(stub_client, statuses=["available"])
+        index.refresh()
+
+        def concurrent_writes():
+            index.upsert(pet(4, "Max"))
+            index.upsert(pet(2, "Rocky", tags=["trained"]))
+            index.remove(1)
+
+        stub_client.during_fetch = concurrent_writes
+        index.refresh(force=True)
+
+        assert index.get(4)["name"] == "Max"
+        assert index.get(2)["tags"] == [{"id": 0, "name": "trained"}]
+        assert index.get(1) is None
+
+    @allure.title("Edits to returned pets do not corrupt the index")
+    @allure.severity(allure.severity_level.CRITICAL)
+    def test_returned_pets_are_copies(self, stub_client):
+        """Test that mutating a found pet and upserting it keeps the secondary indexes consistent"""
+        index = PetIndex(stub_client, statuses=["available", "sold"])
+        index.refresh()
+
+        with allure.step("Mutate a found pet without writing it"):
+            rex = index.find(status="available", name_prefix="Rex")[0]
+            rex["status"] = "sold"
+            rex["name"] = "Max"
+            rex["tags"].append({"id": 9, "name": "trained"})
+            assert index.get(1)["status"] == "available"
+            assert [p["id"] for p in index.find(status="available")] == [1, 2]
+
+        with allure.step("Write the mutated pet, then mutate it again"):
+            index.upsert(rex)
+            rex["status"] = "pending"
+            assert [p["id"] for p in index.find(status="available")] == [2]
+            assert [p["id"] for p in index.find(status="sold", tags=["trained"])] == [1]
+
+        with allure.step("Remove the pet"):
+            index.remove(1)
+            assert [p["id"] for p in index.find(status="available")] == [2]
+            assert index.find_by_name_prefix("Re") == []
+            assert index.find_by_name_prefix("Ma") == []
@@ -0,0 +1,87 @@
+import pytest
+import allure
+import json
+import tracemalloc
+from src.perf.soak import ResourceSampler, SoakRunner, growth_report, parse_duration, store_scenario
+
+
+@allure.epic("Petstore API")
+@allure.feature("Performance Tooling")
+class TestSoakRunner:
+    """Test cases for the soak runner"""
+
+    @allure.title("Growth report computes slope per hour")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_growth_report(self):
+        """Test slope math, nested metrics and skipping non-numeric metrics"""
+        samples = [
+            {"elapsed_s": 0, "rss_bytes": 100, "open_sockets": None, "latency": {"p95_ms": 10.0}},
+            {"elapsed_s": 3600, "rss_bytes": 200, "open_sockets": None, "latency": {"p95_ms": 10.0}},
+            {"elapsed_s": 7200, "rss_bytes": 300, "open_sockets": None, "latency": {"p95_ms": 10.0}},
+        ]
+        report = growth_report(samples)
+
+        assert report["rss_bytes"] == {"first": 100, "last": 300, "delta": 200, "slope_per_hour": 100.0}
+        assert report["latency.p95_ms"]["slope_per_hour"] == 0.0
+        assert "open_sockets" not in report
+        assert "elapsed_s" not in report
+        assert growth_report(samples[:1]) == {}
+
+    @allure.title("Parse durations")
+    @allure.severity(allure.severity_level.MINOR)
+    @pytest.mark.parametrize("value, seconds", [("90", 90), ("2.5s", 2.5), ("15m", 900), ("4h", 14400)])
+    def test_parse_duration(self, value, seconds):
+        """Test duration suffixes"""
+        assert parse_duration(value) == seconds
+
+    @allure.title("Pool stats count the pooled keep-alive connection")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_pool_stats(self, offline_proxy, proxied_api_client):
+        """Test urllib3 pool sampling"""
+        sampler = ResourceSampler(proxied_api_client, trace_allocations=False)
+        assert sampler._pool_stats()["pools"] == 0
+
+        proxied_api_client.get_inventory()
+        proxied_api_client.get_inventory()
+
+        assert sampler._pool_stats() == {"pools": 1, "pool_idle_connections": 1, "pool_opened_connections": 1}
+
+    @allure.title("Soak run writes time series and report")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_soak_run(self, offline_proxy, proxied_api_client, tmp_path):
+        """Test a short soak run against the offline proxy"""
+        output = tmp_path / "soak.jsonl"
+        runner = SoakRunner(proxied_api_client, [store_scenario], str(output), interval=0.3)
+
+        with allure.step("Run for one second"):
+            report = runner.run(duration=1)
+
+        with allure.step("Verify time series"):
+            samples = [json.loads(line) for line in output.read_text().splitlines()]
+            assert len(samples) >= 3
+            assert samples[-1]["iterations"] == report["iterations"] > 0
+            assert samples[-1]["tracemalloc_current_bytes"] is not None
+            assert sum(sample["latency"]["count"] for sample in samples) == report["iterations"] * 4
+
+        with allure.step("Verify report"):
+            assert report["errors"] == 0
+            assert "rss_bytes" in report["growth"]
+            assert json.loads((tmp_path / "soak.report.json").read_text()) == report
+            assert not tracemalloc.is_tracing()
+
+    @allure.title("Interrupted soak run still writes its report")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_soak_run_interrupted(self, offline_proxy, proxied_api_client, tmp_path):
+        """Test that Ctrl-C ends the loop but keeps the final sample, report and tracemalloc cleanup"""
+        def interrupt(client, iteration):
+            if iteration == 2:
+                raise KeyboardInterrupt
+            client.get_inventory()
+
+        output = tmp_path / "soak.jsonl"
+        report = SoakRunner(proxied_api_client, [interrupt], str(output), interval=60).run(duration=60)
+
+        assert report["iterations"] == 2
+        assert len(output.read_text().splitlines()) == 2
+        assert json.loads((tmp_path / "soak.report.json").read_text()) == report
+        assert not tracemalloc.is_tracing()
@@ -99,10 +99,7 @@ class TestUserAPI:
     @allure.title("Create users with list")
     @allure.severity(allure.severity_level.NORMAL)
     @pytest.mark.regression
-    def test
-
-
-_create_users_with_list(self, api_client):
+    def test_create_users_with_list(self, api_client):
         """Test creating multiple users with a list"""
         with allure.step("Create list of users"):
             users_data = [